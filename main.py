@@ -1,10 +1,18 @@
 # Complete YouTube & Instagram Automation System for List-Based Educational Content
 # Main orchestrator file: main.py
+import os
+import json
+import zlib
+import functools
 import schedule
 import time
 import logging
-from datetime import datetime
-from typing import Dict
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple, Iterable, Sequence, Any
+from concurrent.futures import ThreadPoolExecutor, Future
+from contextlib import contextmanager
+import threading
+import queue
 import sqlite3
 
 from src.content_generator import ContentGenerator
@@ -12,6 +20,9 @@ from src.video_creator import VideoCreator
 from src.platform_uploader import PlatformUploader
 from src.data_collector import DataCollector
 
+# Highest number of ? parameters SQLite accepts in a single statement
+SQLITE_MAX_VARIABLES = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -24,7 +35,17 @@ logging.basicConfig(
 
 class YouTubeAutomationSystem:
     def __init__(self):
+        # One SQLite connection per thread, opened lazily by _conn()
+        self.db_path = 'content_tracking.db'
+        self._local = threading.local()
+        
         self.setup_database()
+        
+        # Video records are written by a background thread so callers never wait on disk
+        self._write_q = queue.Queue(maxsize=1024)
+        self._writer = threading.Thread(target=self._writer_loop, name='db-writer', daemon=True)
+        self._writer.start()
+        
         self.data_collector = DataCollector()
         self.content_generator = ContentGenerator()
         self.video_creator = VideoCreator()
@@ -41,10 +62,42 @@ class YouTubeAutomationSystem:
             'sunday': 'trending'
         }
     
+    def _conn(self) -> sqlite3.Connection:
+        """Get this thread's database connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Autocommit mode; writes open explicit transactions via _write_transaction
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            
+            # WAL with synchronous=NORMAL only fsyncs at checkpoints instead of every commit
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-20000")
+            
+            self._local.conn = conn
+        return conn
+    
+    @contextmanager
+    def _write_transaction(self):
+        """Run writes in a transaction that takes the write lock up front"""
+        # BEGIN IMMEDIATE fails fast (after the busy timeout) instead of hitting
+        # SQLITE_BUSY midway when a reader tries to upgrade to a writer
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except Exception:
+            # A failed COMMIT leaves the transaction open; close it so the next
+            # BEGIN on this thread's connection doesn't fail too
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+    
     def setup_database(self):
         """Initialize SQLite database for tracking content"""
-        self.conn = sqlite3.connect('content_tracking.db')
-        cursor = self.conn.cursor()
+        cursor = self._conn().cursor()
         
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS videos (
@@ -59,6 +112,10 @@ class YouTubeAutomationSystem:
             )
         ''')
         
+        # Indexes for the weekly performance analysis queries
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_videos_topic_created ON videos(topic_category, created_date)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_videos_created_views ON videos(created_date, views)")
+        
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS topics_used (
                 id INTEGER PRIMARY KEY,
@@ -68,7 +125,15 @@ class YouTubeAutomationSystem:
             )
         ''')
         
-        self.conn.commit()
+        # Compressed collector output so a re-run of the same day skips the HTTP fetches
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS raw_data_cache (
+                date TEXT,
+                category TEXT,
+                payload BLOB,
+                PRIMARY KEY (date, category)
+            )
+        ''')
     
     def generate_daily_content(self):
         """Main function to generate and upload daily content"""
@@ -79,40 +144,159 @@ class YouTubeAutomationSystem:
             
             logging.info(f"Generating content for {day_name} - Category: {topic_category}")
             
-            # 1. Collect data for the topic
-            raw_data = self.data_collector.get_topic_data(topic_category)
-            
-            # 2. Generate content script
-            content = self.content_generator.create_list_content(raw_data, topic_category)
-            
-            # 3. Create videos (long-form + short-form)
-            video_files = self.video_creator.create_videos(content)
-            
-            # 4. Upload to platforms
-            upload_results = self.uploader.upload_to_platforms(video_files, content)
-            
-            # 5. Save to database
-            self.save_video_record(content, upload_results)
+            self.run_pipeline([topic_category])
             
             logging.info("Daily content generation completed successfully!")
             
         except Exception as e:
             logging.error(f"Error in daily content generation: {str(e)}")
     
-    def save_video_record(self, content: Dict, upload_results: Dict):
-        """Save video information to database"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT INTO videos (title, topic_category, created_date, youtube_url, instagram_url)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (
-            content['title'],
-            content['category'],
-            datetime.now().isoformat(),
-            upload_results.get('youtube_url', ''),
-            upload_results.get('instagram_url', '')
-        ))
-        self.conn.commit()
+    def generate_weekly_content(self):
+        """Generate content for every category in the weekly calendar (backfill)"""
+        try:
+            self.run_pipeline(list(self.content_schedule.values()))
+            logging.info("Weekly content generation completed successfully!")
+            
+        except Exception as e:
+            logging.error(f"Error in weekly content generation: {str(e)}")
+    
+    def run_pipeline(self, categories: List[str]):
+        """Run the content stages for each category with collection and upload overlapping rendering"""
+        # Uploads go through a single worker since the platform clients are shared;
+        # leaving the block waits for queued uploads even if a later category fails
+        with ThreadPoolExecutor(max_workers=4) as fetch_executor, \
+                ThreadPoolExecutor(max_workers=1) as upload_executor:
+            next_data = fetch_executor.submit(self._cached_fetch, categories[0])
+            
+            for i, category in enumerate(categories):
+                # 1. Collect data for the topic (prefetched while the previous one rendered)
+                raw_data = next_data.result()
+                if i + 1 < len(categories):
+                    next_data = fetch_executor.submit(self._cached_fetch, categories[i + 1])
+                
+                # 2. Generate content script
+                content = self.content_generator.create_list_content(raw_data, category)
+                
+                # 3. Create videos (long-form + short-form)
+                video_files = self.video_creator.create_videos(content)
+                
+                # 4. Upload to platforms in the background
+                future = upload_executor.submit(self.uploader.upload_to_platforms, video_files, content)
+                
+                # 5. Save to database as soon as the upload finishes
+                future.add_done_callback(functools.partial(self._record_upload, content))
+    
+    def _record_upload(self, content: Dict, future: Future):
+        """Queue the record of a finished upload"""
+        try:
+            self.save_video_records([(content, future.result())])
+        except Exception as e:
+            logging.error(f"Error uploading {content['title']}: {str(e)}")
+    
+    def _cached_fetch(self, category: str) -> Dict[str, Any]:
+        """Get today's topic data, reusing what an earlier run already collected"""
+        today = datetime.now().date().isoformat()
+        
+        row = self._conn().execute(
+            "SELECT payload FROM raw_data_cache WHERE date = ? AND category = ?", (today, category)
+        ).fetchone()
+        if row:
+            logging.info(f"Using cached {category} data from earlier today")
+            return json.loads(zlib.decompress(row[0]))
+        
+        raw_data = self.data_collector.get_topic_data(category)
+        
+        # Don't pin today's runs to fallback or empty data; let a retry hit the APIs again
+        if raw_data.get('data') and raw_data.get('metadata', {}).get('data_source') != 'Fallback Data':
+            payload = zlib.compress(json.dumps(raw_data).encode('utf-8'))
+            with self._write_transaction() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO raw_data_cache (date, category, payload) VALUES (?, ?, ?)",
+                    (today, category, payload)
+                )
+        
+        return raw_data
+    
+    def save_video_records(self, records: List[Tuple[Dict, Dict]]):
+        """Queue video information for the background database writer"""
+        created_date = datetime.now().isoformat()
+        for content, upload_results in records:
+            self._write_q.put((
+                content['title'],
+                content['category'],
+                created_date,
+                upload_results.get('youtube_url', ''),
+                upload_results.get('instagram_url', '')
+            ))
+    
+    def _writer_loop(self, batch_size: int = 100):
+        """Drain queued video rows into the database, one transaction per batch"""
+        while True:
+            batch = [self._write_q.get()]
+            while len(batch) < batch_size:
+                try:
+                    batch.append(self._write_q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                # OR IGNORE keeps one duplicate title from rolling back the whole batch;
+                # rows go in one at a time so the skipped ones can be reported
+                skipped = []
+                with self._write_transaction() as conn:
+                    for row in batch:
+                        cursor = conn.execute('''
+                            INSERT OR IGNORE INTO videos (title, topic_category, created_date, youtube_url, instagram_url)
+                            VALUES (?, ?, ?, ?, ?)
+                        ''', row)
+                        if cursor.rowcount == 0:
+                            skipped.append(row)
+                
+                for title, _, _, youtube_url, instagram_url in skipped:
+                    logging.warning(
+                        f"Video record not saved, title already exists: {title} "
+                        f"(youtube: {youtube_url or '-'}, instagram: {instagram_url or '-'})"
+                    )
+            except Exception as e:
+                logging.error(f"Error saving {len(batch)} video records: {str(e)}")
+            finally:
+                for _ in batch:
+                    self._write_q.task_done()
+    
+    def flush_writes(self):
+        """Block until all queued video records have been written"""
+        self._write_q.join()
+    
+    def _bulk_insert(self, table: str, cols: Sequence[str], rows: Iterable[Sequence], chunk: int = 500) -> int:
+        """Insert many rows with multi-row VALUES statements in one transaction, returning how many were inserted"""
+        # Rows that violate a UNIQUE constraint (e.g. a title already imported) are skipped
+        rows = list(rows)
+        chunk = max(1, min(chunk, SQLITE_MAX_VARIABLES // len(cols)))
+        row_placeholder = "(" + ",".join("?" * len(cols)) + ")"
+        
+        with self._write_transaction() as conn:
+            changes_before = conn.total_changes
+            for start in range(0, len(rows), chunk):
+                batch = rows[start:start + chunk]
+                sql = f"INSERT OR IGNORE INTO {table}({','.join(cols)}) VALUES " + ",".join([row_placeholder] * len(batch))
+                conn.execute(sql, [value for row in batch for value in row])
+            inserted = conn.total_changes - changes_before
+        
+        if inserted < len(rows):
+            logging.info(f"Skipped {len(rows) - inserted} {table} rows that already exist")
+        return inserted
+    
+    def import_video_records(self, rows: Iterable[Tuple[str, str, str, str, str]]) -> int:
+        """Bulk import historical (title, category, created_date, youtube_url, instagram_url) rows"""
+        return self._bulk_insert(
+            'videos',
+            ('title', 'topic_category', 'created_date', 'youtube_url', 'instagram_url'),
+            rows
+        )
+    
+    def import_topics_used(self, rows: Iterable[Tuple[str, str, int]]) -> int:
+        """Bulk import historical (topic, last_used, usage_count) rows"""
+        return self._bulk_insert('topics_used', ('topic', 'last_used', 'usage_count'), rows)
     
     def start_automation(self):
         """Start the automated scheduling system"""
@@ -126,19 +310,32 @@ class YouTubeAutomationSystem:
         
         while True:
             schedule.run_pending()
-            time.sleep(3600)  # Check every hour
+            
+            # Sleep until the next job is due instead of polling
+            idle = schedule.idle_seconds()
+            if idle is None:
+                break
+            if idle > 0:
+                time.sleep(min(idle, 3600))
     
     def analyze_performance(self):
         """Analyze video performance and optimize"""
         # Implementation for performance analysis
         logging.info("Running weekly performance analysis...")
+        
+        # Evict collector data older than 30 days
+        cutoff = (datetime.now() - timedelta(days=30)).date().isoformat()
+        with self._write_transaction() as conn:
+            conn.execute("DELETE FROM raw_data_cache WHERE date < ?", (cutoff,))
 
 if __name__ == "__main__":
     # Initialize and start the automation system
     system = YouTubeAutomationSystem()
-    import ipdb; ipdb.set_trace()
+    if os.getenv("DEBUG_BREAK"):
+        import ipdb; ipdb.set_trace()
     # For testing, run once
     system.generate_daily_content()
+    system.flush_writes()
     
     # For production, start automation
     # system.start_automation()
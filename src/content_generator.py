@@ -1,155 +1,337 @@
 """ For Generating engaging scripts from data """
 import os
-# import logging
+import json
+import logging
+import functools
 import openai
 import random
-from typing import Dict, List, Any
+from typing import Dict, List, Tuple, Any, Optional, Callable
 
-# logging.basicConfig(level=logging.INFO)
+from src.script_cache import ScriptCache
 
 
-class ContentGenerator:
-    def __init__(self):
-        openai.api_key = os.getenv('OPENAI_API_KEY')
-        
-        # Title templates for viral appeal
-        self.title_templates = {
-            'geography': [
-                "10 Countries That Technically Don't Exist",
-                "Mind-Blowing Facts About {} Countries",
-                "Countries With the Weirdest Laws You Won't Believe",
-                "10 Places on Earth That Look Like Another Planet"
-            ],
-            'history': [
-                "Historical Events That Changed Everything",
-                "10 Mysteries From History We Still Can't Solve", 
-                "Shocking Facts About {} That Schools Don't Teach",
-                "Historical Figures Who Were Actually Terrible People"
-            ],
-            'science': [
-                "Scientific Facts That Will Blow Your Mind",
-                "10 Scientific Discoveries That Shocked the World",
-                "Science Facts That Sound Fake But Are True",
-                "Mind-Bending Scientific Phenomena Explained"
-            ]
+# Title templates for viral appeal
+TITLE_TEMPLATES: Dict[str, Tuple[str, ...]] = {
+    'geography': (
+        "10 Countries That Technically Don't Exist",
+        "Mind-Blowing Facts About {} Countries",
+        "Countries With the Weirdest Laws You Won't Believe",
+        "10 Places on Earth That Look Like Another Planet"
+    ),
+    'history': (
+        "Historical Events That Changed Everything",
+        "10 Mysteries From History We Still Can't Solve",
+        "Shocking Facts About {} That Schools Don't Teach",
+        "Historical Figures Who Were Actually Terrible People"
+    ),
+    'science': (
+        "Scientific Facts That Will Blow Your Mind",
+        "10 Scientific Discoveries That Shocked the World",
+        "Science Facts That Sound Fake But Are True",
+        "Mind-Bending Scientific Phenomena Explained"
+    )
+}
+DEFAULT_TITLE_TEMPLATES = ("10 Amazing Facts About {}",)
+
+# Words substituted into the {} slot of a category's title templates
+TITLE_FILLERS: Dict[str, Tuple[str, ...]] = {
+    'geography': ('Amazing', 'Incredible', 'Shocking'),
+    'history': ('Ancient Times', 'The Past', 'World History')
+}
+
+# Hook templates to grab attention
+HOOKS: Tuple[str, ...] = (
+    "You won't believe what I discovered about {}...",
+    "Most people have no idea that {}...",
+    "This is going to completely change how you think about {}...",
+    "I spent hours researching this, and what I found shocked me...",
+    "Number 3 on this list will absolutely blow your mind..."
+)
+
+# SEO tags per category
+CATEGORY_TAGS: Dict[str, Tuple[str, ...]] = {
+    'geography': ('countries', 'geography', 'world facts', 'travel', 'educational'),
+    'history': ('history', 'historical facts', 'ancient', 'past events', 'educational'),
+    'science': ('science', 'scientific facts', 'discoveries', 'research', 'educational'),
+    'space': ('space', 'astronomy', 'nasa', 'universe', 'cosmos'),
+    'technology': ('technology', 'tech facts', 'innovation', 'future', 'gadgets')
+}
+DEFAULT_TAGS = ('educational', 'facts', 'top 10')
+
+# Fixed script parts around the generated list
+_INTRO_PRE = "Welcome back to the channel! Today we're diving into "
+_INTRO_POST = ". Make sure to subscribe and hit that notification bell because this content is absolutely mind-blowing!"
+_CONCLUSION = "Which fact surprised you the most? Let me know in the comments below! And if you enjoyed this video, smash that like button and subscribe for more incredible content like this!"
+
+# (threshold, suffix) pairs for spoken numbers, largest first
+_SCALES = (
+    (1_000_000, 'million'),
+    (1_000, 'thousand')
+)
+
+
+def _format_number(num: int) -> str:
+    """Format large numbers for readability"""
+    for threshold, suffix in _SCALES:
+        if num >= threshold:
+            return f"{num/threshold:.1f} {suffix}"
+    return str(num)
+
+
+def _fmt_geo(number: int, item: Dict) -> str:
+    """Narration for a geography item"""
+    return f"Number {number}: {item['name']}. {item.get('interesting_fact', 'This country has unique features.')} With a population of {_format_number(item.get('population', 0))}, it's truly fascinating."
+
+
+def _fmt_topic(number: int, item: Dict) -> str:
+    """Narration for a history/science style item"""
+    return f"Number {number}: {item['topic']}. {item.get('summary', 'This topic is incredibly important.')} {item.get('importance', '')}"
+
+
+def _fmt_generic(number: int, item: Dict) -> str:
+    """Narration for an item of unknown shape"""
+    return f"Number {number}: {str(item)}"
+
+
+# Item shape (which of the discriminating keys it has) -> narration formatter;
+# 'name' takes precedence when an item has both
+_SHAPE_KEYS = frozenset({'name', 'topic'})
+_FORMATTERS: Dict[frozenset, Callable[[int, Dict], str]] = {
+    frozenset({'name'}): _fmt_geo,
+    frozenset({'name', 'topic'}): _fmt_geo,
+    frozenset({'topic'}): _fmt_topic
+}
+
+# Model used for script generation
+OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
+
+# Structured output returned by the single generation call
+CONTENT_SCHEMA = {
+    "name": "list_video_content",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "additionalProperties": False,
+        "required": ["title", "script", "metadata"],
+        "properties": {
+            "title": {"type": "string"},
+            "script": {
+                "type": "object",
+                "additionalProperties": False,
+                "required": ["hook", "intro", "list_items", "conclusion"],
+                "properties": {
+                    "hook": {"type": "string"},
+                    "intro": {"type": "string"},
+                    "list_items": {"type": "string"},
+                    "conclusion": {"type": "string"}
+                }
+            },
+            "metadata": {
+                "type": "object",
+                "additionalProperties": False,
+                "required": ["description", "tags"],
+                "properties": {
+                    "description": {"type": "string"},
+                    "tags": {"type": "array", "items": {"type": "string"}}
+                }
+            }
         }
+    }
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_templates(category: str) -> Tuple[str, ...]:
+    """Title templates for a category"""
+    return TITLE_TEMPLATES.get(category, DEFAULT_TITLE_TEMPLATES)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_tags(category: str) -> Tuple[str, ...]:
+    """SEO tags for a category"""
+    return CATEGORY_TAGS.get(category, DEFAULT_TAGS)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_system_prompt(category: str) -> str:
+    """Build static per-category instructions for the LLM"""
+    # Nothing per-call (dates, random picks, raw data) may go in here:
+    # the prefix must stay byte-identical to hit the provider's prompt cache
+    return "\n".join([
+        "You write viral list-style educational scripts for YouTube and Instagram.",
+        f"Category: {category}",
+        "Example titles:",
+        *(f"- {template}" for template in _get_templates(category)),
+        "Example hooks:",
+        *(f"- {hook}" for hook in HOOKS),
+        f"SEO tags: {', '.join(_get_tags(category))}",
+        "The user message contains the facts to cover as JSON."
+    ])
+
+
+_configured = False
+
+
+def _configure_openai():
+    """Read the OpenAI API key from the environment once per process"""
+    global _configured
+    if not _configured:
+        openai.api_key = openai.api_key or os.getenv('OPENAI_API_KEY')
+        _configured = True
+
+
+class ContentGenerator:
+    __slots__ = ('cache', '_rng')
+    
+    def __init__(self, seed: Optional[int] = None):
+        _configure_openai()
         
-        # Hook templates to grab attention
-        self.hooks = [
-            "You won't believe what I discovered about {}...",
-            "Most people have no idea that {}...",
-            "This is going to completely change how you think about {}...",
-            "I spent hours researching this, and what I found shocked me...",
-            "Number 3 on this list will absolutely blow your mind..."
-        ]
+        # Private RNG so parallel workers don't contend on the global one;
+        # pass a seed for reproducible titles and hooks
+        self._rng = random.Random(seed)
+        
+        # Cache of previously generated content keyed by input data
+        self.cache = ScriptCache()
     
     def create_list_content(self, raw_data: Dict, category: str) -> Dict[str, Any]:
         """Generate complete content from raw data"""
         
-        # Generate engaging title
-        title = self.generate_title(raw_data, category)
+        # Reuse content generated for identical or near-identical data; a near-identical
+        # hit carries the raw_data its script was written from, so narration and visuals match
+        cached = self.cache.get(raw_data, category)
+        if cached:
+            logging.info(f"Using cached content for {category}")
+            return cached
+        
+        # One LLM round-trip for title, script and metadata, with templates as fallback
+        generated = self._generate_all(raw_data, category) if openai.api_key else None
+        
+        if generated is None:
+            # Generate engaging title
+            title = self.generate_title(raw_data, category)
+            
+            # Generate script with hook, list items, and conclusion
+            script = self.generate_script(raw_data, title, category)
+            
+            # Generate metadata for SEO
+            metadata = self.generate_metadata(title, category)
+            
+            generated = {
+                'title': title,
+                'script': script,
+                'category': category,
+                'metadata': metadata,
+                'estimated_duration': self.estimate_duration(script)
+            }
+        else:
+            # Only LLM output is cached; a cached template fallback would keep a
+            # transient API error from ever being retried for this input
+            self.cache.put(raw_data, category, generated)
+        
+        return {**generated, 'raw_data': raw_data}
+    
+    def _generate_all(self, raw_data: Dict, category: str) -> Optional[Dict[str, Any]]:
+        """Generate title, script and metadata in a single structured LLM call"""
+        try:
+            response = openai.chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=self._build_messages(raw_data, category),
+                response_format={"type": "json_schema", "json_schema": CONTENT_SCHEMA}
+            )
+            result = json.loads(response.choices[0].message.content)
+        except Exception as e:
+            logging.warning(f"LLM generation failed, falling back to templates: {str(e)}")
+            return None
+        
+        # Template selection is a post-processing step so it never enters the prompt
+        title = result['title'] or self.generate_title(raw_data, category)
         
-        # Generate script with hook, list items, and conclusion
-        script = self.generate_script(raw_data, title, category)
+        parts = result['script']
+        script = self._assemble_script(parts['hook'], parts['intro'], parts['list_items'], parts['conclusion'])
         
-        # Generate metadata for SEO
         metadata = self.generate_metadata(title, category)
+        metadata['description'] = result['metadata']['description'] or metadata['description']
+        metadata['tags'] = result['metadata']['tags'] or metadata['tags']
         
         return {
             'title': title,
             'script': script,
             'category': category,
             'metadata': metadata,
-            'raw_data': raw_data,
             'estimated_duration': self.estimate_duration(script)
         }
     
+    def _build_messages(self, raw_data: Dict, category: str) -> List[Dict[str, str]]:
+        """Build chat messages with the static prefix first and data last"""
+        return [
+            {"role": "system", "content": _build_system_prompt(category)},
+            {"role": "user", "content": json.dumps(raw_data, sort_keys=True)}
+        ]
+    
     def generate_title(self, data: Dict, category: str) -> str:
         """Generate viral-friendly title"""
-        templates = self.title_templates.get(category, ["10 Amazing Facts About {}"])
-        template = random.choice(templates)
+        template = self._rng.choice(_get_templates(category))
         
-        if category == 'geography':
-            return template.format(random.choice(['Amazing', 'Incredible', 'Shocking']))
-        elif category == 'history':  
-            return template.format(random.choice(['Ancient Times', 'The Past', 'World History']))
-        else:
-            return template
+        fillers = TITLE_FILLERS.get(category)
+        if fillers:
+            return template.format(self._rng.choice(fillers))
+        return template
     
-    def generate_script(self, data: Dict, title: str, category: str) -> Dict[str, str]:
+    def generate_script(self, data: Dict, title: str, category: str) -> Dict[str, Any]:
         """Generate complete video script"""
         
         # Hook (first 5 seconds)
-        hook = random.choice(self.hooks).format(category)
+        hook = self._rng.choice(HOOKS).format(category)
         
         # Introduction
-        intro = f"Welcome back to the channel! Today we're diving into {title.lower()}. Make sure to subscribe and hit that notification bell because this content is absolutely mind-blowing!"
+        intro = "".join((_INTRO_PRE, title.lower(), _INTRO_POST))
         
         # Main content (list items)
         list_items = self.generate_list_items(data['data'])
         
-        # Conclusion and CTA
-        conclusion = "Which fact surprised you the most? Let me know in the comments below! And if you enjoyed this video, smash that like button and subscribe for more incredible content like this!"
+        return self._assemble_script(hook, intro, list_items, _CONCLUSION)
+    
+    def _assemble_script(self, hook: str, intro: str, list_items: str, conclusion: str) -> Dict[str, Any]:
+        """Combine script parts into the script dict used downstream"""
+        parts = (hook, intro, list_items, conclusion)
         
         return {
             'hook': hook,
             'intro': intro,
             'list_items': list_items,
             'conclusion': conclusion,
-            'full_script': f"{hook} {intro} {list_items} {conclusion}"
+            'full_script': " ".join(parts),
+            # Counting spaces is a single C-level scan, unlike split()
+            'word_count': sum(part.count(" ") + 1 for part in parts if part)
         }
     
     def generate_list_items(self, data_items: List[Dict]) -> str:
         """Generate list items with engaging narration"""
-        list_script = ""
-        
-        for i, item in enumerate(data_items[:10], 1):  # Top 10 list
-            if isinstance(item, dict):
-                item_script = self.format_list_item(i, item)
-                list_script += item_script + " "
-        
-        return list_script
+        return " ".join(
+            self.format_list_item(i, item)
+            for i, item in enumerate(data_items[:10], 1)  # Top 10 list
+            if isinstance(item, dict)
+        )
     
     def format_list_item(self, number: int, item: Dict) -> str:
         """Format individual list item"""
-        if 'name' in item:  # Geography item
-            return f"Number {number}: {item['name']}. {item.get('interesting_fact', 'This country has unique features.')} With a population of {self.format_number(item.get('population', 0))}, it's truly fascinating."
-        
-        elif 'topic' in item:  # History/Science item  
-            return f"Number {number}: {item['topic']}. {item.get('summary', 'This topic is incredibly important.')} {item.get('importance', '')}"
-        
-        else:
-            return f"Number {number}: {str(item)}"
+        return _FORMATTERS.get(_SHAPE_KEYS.intersection(item), _fmt_generic)(number, item)
     
     def format_number(self, num: int) -> str:
         """Format large numbers for readability"""
-        if num >= 1_000_000:
-            return f"{num/1_000_000:.1f} million"
-        elif num >= 1_000:
-            return f"{num/1_000:.1f} thousand"
-        else:
-            return str(num)
+        return _format_number(num)
     
     def generate_metadata(self, title: str, category: str) -> Dict[str, Any]:
         """Generate SEO metadata"""
-        tags = {
-            'geography': ['countries', 'geography', 'world facts', 'travel', 'educational'],
-            'history': ['history', 'historical facts', 'ancient', 'past events', 'educational'],
-            'science': ['science', 'scientific facts', 'discoveries', 'research', 'educational'],
-            'space': ['space', 'astronomy', 'nasa', 'universe', 'cosmos'],
-            'technology': ['technology', 'tech facts', 'innovation', 'future', 'gadgets']
-        }
-        
         description = f"Discover amazing facts in this educational video about {category}. {title} - Subscribe for more incredible content!"
         
         return {
             'description': description,
-            'tags': tags.get(category, ['educational', 'facts', 'top 10']),
+            'tags': list(_get_tags(category)),
             'thumbnail_text': f"TOP 10\n{category.upper()}\nFACTS"
         }
     
     def estimate_duration(self, script: Dict) -> int:
         """Estimate video duration in seconds"""
         # Rough estimation: 150 words per minute
-        word_count = len(script['full_script'].split())
-        return int((word_count / 150) * 60)
\ No newline at end of file
+        return int((script['word_count'] / 150) * 60)
\ No newline at end of file
@@ -1,64 +1,240 @@
 # data_collector.py - Data collection from various sources
 import os, logging
-import requests
-import wikipedia
+import re
+import orjson
+import functools
+import asyncio
+import threading
+import httpx
 import random
 import logging
-from typing import Dict, Any
+from urllib.parse import quote, urlencode
+from typing import Dict, Any, List, Tuple, Optional, Callable
+
+from src.http_cache import HttpCache
 
 logging.basicConfig(level=logging.INFO)
 
+# Four-digit years from 1900-2099
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+
+# Words that suggest a sentence holds a superlative or surprising fact
+_INTERESTING_RE = re.compile(
+    r'\b(?:first|largest|smallest|only|never|most|least|discovered|invented)\b',
+    re.IGNORECASE
+)
+
+# A 20-200 character sentence starting right after the previous one's end mark;
+# longer sentences fail at their first character instead of matching a tail
+_SENT_RE = re.compile(r'(?:^|(?<=[.!?]))\s*([^.!?]{20,200})[.!?]')
+
+# REST Countries fields read by get_geography_data; the full records are several MB
+COUNTRY_FIELDS = "name,capital,population,area,region,languages,currencies,flags"
+
+# Only the lead of an article is scanned for sentences
+_SCAN_CHARS = 4000
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to limit characters, marking the cut with an ellipsis"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _sentences(text: str):
+    """Lazily yield stripped sentences from the start of a text"""
+    for match in _SENT_RE.finditer(text, 0, _SCAN_CHARS):
+        yield match.group(1).strip()
+
+
+def _random_country_sentence(summary: str) -> Optional[str]:
+    """Pick a random candidate fact sentence from a country summary, or None"""
+    # Reservoir sampling: one pass over the sentences without collecting them
+    chosen = None
+    for seen, sentence in enumerate((s for s in _sentences(summary) if 50 < len(s) < 200), 1):
+        if random.randrange(seen) == 0:
+            chosen = sentence
+    return chosen
+
+
+@functools.lru_cache(maxsize=512)
+def _interesting_fact(text: str) -> str:
+    """Extract an interesting fact from a larger text"""
+    first = None
+    
+    # Look for sentences with numbers, superlatives, or surprising facts
+    for sentence in _sentences(text):
+        if 20 < len(sentence) < 150:
+            if _INTERESTING_RE.search(sentence):
+                return sentence
+            first = first or sentence
+    
+    # Fallback to first meaningful sentence
+    if first:
+        return first
+    
+    return _truncate(text, 150)
+
+
+def _page_url(page: Dict[str, Any]) -> str:
+    """Article URL from a MediaWiki query page or a REST page summary"""
+    return page.get('fullurl') or page.get('content_urls', {}).get('desktop', {}).get('page', '')
+
+
+# Topics sampled by each Wikipedia-backed collector
+HISTORICAL_TOPICS: Tuple[str, ...] = (
+    "Ancient Egypt", "Roman Empire", "World War II", "Renaissance",
+    "Industrial Revolution", "Cold War", "Ancient Greece", "Viking Age",
+    "Mongol Empire", "American Revolution"
+)
+SCIENCE_TOPICS: Tuple[str, ...] = (
+    "Quantum physics", "DNA", "Theory of relativity", "Evolution",
+    "Photosynthesis", "Black holes", "Antibiotics", "Periodic table",
+    "Genetics", "Climate change"
+)
+SPACE_TOPICS: Tuple[str, ...] = (
+    "Black hole", "Solar System", "Mars exploration", "International Space Station",
+    "Hubble Space Telescope", "Space exploration", "Milky Way", "Supernova",
+    "Exoplanet", "Dark matter"
+)
+TECH_TOPICS: Tuple[str, ...] = (
+    "Artificial Intelligence", "Quantum Computing", "Blockchain",
+    "Internet of Things", "5G technology", "Cloud computing",
+    "Machine Learning", "Virtual Reality", "Robotics", "Cybersecurity"
+)
+PSYCH_TOPICS: Tuple[str, ...] = (
+    "Cognitive psychology", "Behavioral psychology", "Social psychology",
+    "Developmental psychology", "Personality theory", "Mental health",
+    "Psychological theories", "Human behavior", "Memory", "Emotions"
+)
+
+# Statement templates; {} is replaced with the topic
+IMPORTANCE_TEMPLATES: Tuple[str, ...] = (
+    "{} revolutionized our understanding of the natural world.",
+    "The discovery of {} changed the course of scientific history.",
+    "{} remains one of the most important concepts in modern science.",
+    "Understanding {} is crucial for advancing human knowledge."
+)
+TECH_IMPACT_TEMPLATES: Tuple[str, ...] = (
+    "{} is revolutionizing how we live and work.",
+    "The impact of {} on society is profound and far-reaching.",
+    "{} represents a major breakthrough in technological advancement.",
+    "The development of {} marks a new era in human innovation."
+)
+PSYCHOLOGY_IMPACT_TEMPLATES: Tuple[str, ...] = (
+    "Understanding {} helps us improve mental health and well-being.",
+    "Research in {} has transformed our understanding of human behavior.",
+    "{} provides crucial insights into human development and behavior.",
+    "The study of {} continues to enhance our understanding of the mind."
+)
+
 
 class DataCollector:
+    wikipedia_api = "https://en.wikipedia.org/api/rest_v1/"
+    countries_api = "https://restcountries.com/v3.1/"
+    mediawiki_api = "https://en.wikipedia.org/w/api.php"
+    
     def __init__(self):
-        self.wikipedia_api = "https://en.wikipedia.org/api/rest_v1/"
-        self.countries_api = "https://restcountries.com/v3.1/"
+        # Read per instance so a key set after import (e.g. by dotenv) is picked up
         self.nasa_api_key = os.getenv('NASA_API_KEY', 'DEMO_KEY')
         
+        # Wikipedia and REST Countries responses barely change day to day
+        self.http_cache = HttpCache('wiki_cache.sqlite', expire_after=86400)
+        
+        # One long-lived event loop owns the shared HTTP client so keep-alive
+        # connections (and their TLS sessions) survive between collector calls
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name='collector-loop', daemon=True).start()
+        self.http = httpx.AsyncClient(
+            http2=True,
+            timeout=10,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+            follow_redirects=True,  # REST summaries redirect to the canonical title
+            headers={'User-Agent': 'content-generator/1.0'}
+        )
+        
+        # Category -> collector; anything else gets trending data
+        self._dispatch = {
+            'geography': self.get_geography_data,
+            'history': self.get_history_data,
+            'science': self.get_science_data,
+            'space': self.get_space_data,
+            'technology': self.get_technology_data,
+            'psychology': self.get_psychology_data
+        }
+        
     def get_topic_data(self, category: str) -> Dict[str, Any]:
         """Get data based on topic category"""
-        if category == 'geography':
-            return self.get_geography_data()
-        elif category == 'history':
-            return self.get_history_data()
-        elif category == 'science':
-            return self.get_science_data()
-        elif category == 'space':
-            return self.get_space_data()
-        elif category == 'technology':
-            return self.get_technology_data()
-        elif category == 'psychology':
-            return self.get_psychology_data()
-        else:
-            return self.get_trending_data()
+        return self._dispatch.get(category, self.get_trending_data)()
+    
+    def _run(self, coro) -> Any:
+        """Run a coroutine on the collector loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+    
+    async def _aget_json(self, url: str) -> Any:
+        """GET a JSON resource, serving it from the on-disk cache when possible"""
+        cached = self.http_cache.get(url)
+        if cached and cached.fresh:
+            return orjson.loads(cached.body)
+        
+        # Revalidate stale entries; a 304 costs no body transfer
+        headers = {'If-None-Match': cached.etag} if cached and cached.etag else {}
+        response = await self.http.get(url, headers=headers)
+        if response.status_code == 304 and cached:
+            self.http_cache.touch(url)
+            return orjson.loads(cached.body)
+        
+        response.raise_for_status()
+        self.http_cache.put(url, response.headers.get('etag'), response.content)
+        return orjson.loads(response.content)
+    
+    async def _afetch_summary(self, topic: str) -> Dict[str, Any]:
+        """Fetch a page summary from the Wikipedia REST API"""
+        # Titles go in the path, so slashes (e.g. "AC/DC") must be escaped; underscores
+        # match the canonical title form and avoid a redirect hop
+        return await self._aget_json(f"{self.wikipedia_api}page/summary/{quote(topic.replace(' ', '_'), safe='')}")
     
     def get_geography_data(self) -> Dict[str, Any]:
         """Collect geography and country facts"""
+        return self._run(self._a_get_geography_data())
+    
+    async def _a_get_geography_data(self) -> Dict[str, Any]:
+        """Async implementation of get_geography_data"""
         try:
-            # Get all countries
-            response = requests.get(f"{self.countries_api}all")
-            countries = response.json()
+            # Get all countries, projected down to the fields used below
+            countries = await self._aget_json(f"{self.countries_api}all?fields={COUNTRY_FIELDS}")
+            
+            # Only countries with a common name can be looked up on Wikipedia
+            candidates = [country for country in countries if (country.get('name') or {}).get('common')]
+            
+            # Select 10 random countries and fetch their facts concurrently
+            sampled = random.sample(candidates, 10)
+            names = [country['name']['common'] for country in sampled]
+            facts = await asyncio.gather(*[
+                self._a_country_fact(name) for name in names
+            ])
             
-            # Select interesting countries with unique facts
             interesting_facts = []
             
-            for country in random.sample(countries, 15):  # Get 15 random countries
-                fact_data = {
-                    'name': country.get('name', {}).get('common', 'Unknown'),
-                    'capital': country.get('capital', ['Unknown'])[0] if country.get('capital') else 'Unknown',
+            for country, name, fact in zip(sampled, names, facts):
+                capitals = country.get('capital') or ['Unknown']
+                languages = country.get('languages') or {}
+                currencies = country.get('currencies') or {}
+                
+                interesting_facts.append({
+                    'name': name,
+                    'capital': capitals[0],
                     'population': country.get('population', 0),
                     'area': country.get('area', 0),
                     'region': country.get('region', 'Unknown'),
-                    'languages': list(country.get('languages', {}).values()) if country.get('languages') else [],
-                    'currencies': list(country.get('currencies', {}).keys()) if country.get('currencies') else [],
-                    'flag': country.get('flags', {}).get('png', ''),
-                    'interesting_fact': self.get_country_interesting_fact(country.get('name', {}).get('common', ''))
-                }
-                interesting_facts.append(fact_data)
+                    'languages': list(languages.values()),
+                    'currencies': list(currencies.keys()),
+                    'flag': (country.get('flags') or {}).get('png', ''),
+                    'interesting_fact': fact
+                })
             
             return {
                 'category': 'geography',
-                'data': interesting_facts[:10],  # Top 10 for the list
+                'data': interesting_facts,  # Top 10 for the list
                 'metadata': {
                     'total_countries': len(countries),
                     'data_source': 'REST Countries API'
@@ -71,44 +247,80 @@ class DataCollector:
     
     def get_country_interesting_fact(self, country_name: str) -> str:
         """Get an interesting fact about a country using Wikipedia"""
+        return self._run(self._a_country_fact(country_name))
+    
+    async def _a_country_fact(self, country_name: str) -> str:
+        """Async implementation of get_country_interesting_fact"""
         try:
-            page = wikipedia.page(country_name, auto_suggest=False)
-            summary = page.summary
+            page = await self._afetch_summary(country_name)
             
             # Extract interesting sentences (simple approach)
-            sentences = summary.split('.')
-            interesting_sentences = [s.strip() for s in sentences if len(s.strip()) > 50 and len(s.strip()) < 200]
+            sentence = _random_country_sentence(page['extract'])
             
-            return random.choice(interesting_sentences) if interesting_sentences else "This country has a rich history and culture."
+            return sentence or "This country has a rich history and culture."
             
         except:
             return f"{country_name} has unique geographical and cultural features."
     
-    def get_history_data(self) -> Dict[str, Any]:
-        """Collect historical facts and events"""
-        historical_topics = [
-            "Ancient Egypt", "Roman Empire", "World War II", "Renaissance", 
-            "Industrial Revolution", "Cold War", "Ancient Greece", "Viking Age",
-            "Mongol Empire", "American Revolution"
-        ]
+    async def _afetch_extracts(self, topics: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch intro extracts for several titles in one MediaWiki query, keyed by requested title"""
+        # Sorted so the same topic set always hits the same cache entry
+        params = {
+            'action': 'query',
+            'prop': 'extracts|info',
+            'exintro': 1,
+            'explaintext': 1,
+            'exlimit': 'max',
+            'inprop': 'url',
+            'redirects': 1,
+            'format': 'json',
+            'formatversion': 2,
+            'titles': '|'.join(sorted(topics))
+        }
+        query = (await self._aget_json(f"{self.mediawiki_api}?{urlencode(params)}"))['query']
+        
+        # The response is keyed by canonical title; follow normalization and redirects
+        # (e.g. "Black holes" -> "Black hole") back to the title that was asked for
+        renamed = {entry['from']: entry['to'] for entry in query.get('normalized', []) + query.get('redirects', [])}
+        pages = {page['title']: page for page in query.get('pages', []) if 'extract' in page}
         
-        historical_facts = []
+        results = {}
+        for topic in topics:
+            # Track visited titles so a redirect cycle (A -> B -> A) can't loop forever
+            title, seen = topic, {topic}
+            while title in renamed and title not in pages and renamed[title] not in seen:
+                title = renamed[title]
+                seen.add(title)
+            if title in pages:
+                results[topic] = pages[title]
+        return results
+    
+    async def _a_collect_topics(self, topics: List[str], build: Callable[[str, Dict[str, Any]], Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Fetch and build facts for several topics with a single request, skipping failures"""
+        try:
+            pages = await self._afetch_extracts(topics)
+        except Exception as e:
+            logging.warning(f"Could not fetch data for {', '.join(topics)}: {str(e)}")
+            return []
         
-        for topic in random.sample(historical_topics, 10):
+        results = []
+        for topic in topics:
+            if topic not in pages:
+                logging.warning(f"Could not fetch data for {topic}: no extract returned")
+                continue
             try:
-                page = wikipedia.page(topic)
-                summary = page.summary
-                
-                fact_data = {
-                    'topic': topic,
-                    'summary': summary[:300] + "..." if len(summary) > 300 else summary,
-                    'interesting_fact': self.extract_interesting_fact(summary),
-                    'url': page.url
-                }
-                historical_facts.append(fact_data)
-                
+                results.append(build(topic, pages[topic]))
             except Exception as e:
                 logging.warning(f"Could not fetch data for {topic}: {str(e)}")
+        return results
+    
+    def get_history_data(self) -> Dict[str, Any]:
+        """Collect historical facts and events"""
+        return self._run(self._a_get_history_data())
+    
+    async def _a_get_history_data(self) -> Dict[str, Any]:
+        """Async implementation of get_history_data"""
+        historical_facts = await self._a_collect_topics(random.sample(HISTORICAL_TOPICS, 10), self._history_fact)
         
         return {
             'category': 'history',
@@ -119,31 +331,23 @@ class DataCollector:
             }
         }
     
+    def _history_fact(self, topic: str, page: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a history fact from a page summary"""
+        summary = page['extract']
+        return {
+            'topic': topic,
+            'summary': _truncate(summary, 300),
+            'interesting_fact': self.extract_interesting_fact(summary),
+            'url': _page_url(page)
+        }
+    
     def get_science_data(self) -> Dict[str, Any]:
         """Collect science facts and discoveries"""
-        science_topics = [
-            "Quantum physics", "DNA", "Theory of relativity", "Evolution",
-            "Photosynthesis", "Black holes", "Antibiotics", "Periodic table",
-            "Genetics", "Climate change"
-        ]
-        
-        science_facts = []
-        
-        for topic in random.sample(science_topics, 10):
-            try:
-                page = wikipedia.page(topic)
-                summary = page.summary
-                
-                fact_data = {
-                    'topic': topic,
-                    'summary': summary[:250] + "..." if len(summary) > 250 else summary,
-                    'discovery_year': self.extract_year_from_text(summary),
-                    'importance': self.generate_importance_statement(topic)
-                }
-                science_facts.append(fact_data)
-                
-            except Exception as e:
-                logging.warning(f"Could not fetch data for {topic}: {str(e)}")
+        return self._run(self._a_get_science_data())
+    
+    async def _a_get_science_data(self) -> Dict[str, Any]:
+        """Async implementation of get_science_data"""
+        science_facts = await self._a_collect_topics(random.sample(SCIENCE_TOPICS, 10), self._science_fact)
         
         return {
             'category': 'science',
@@ -154,57 +358,50 @@ class DataCollector:
             }
         }
     
+    def _science_fact(self, topic: str, page: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a science fact from a page summary"""
+        summary = page['extract']
+        return {
+            'topic': topic,
+            'summary': _truncate(summary, 250),
+            'discovery_year': self.extract_year_from_text(summary),
+            'importance': self.generate_importance_statement(topic)
+        }
+
     def extract_interesting_fact(self, text: str) -> str:
         """Extract an interesting fact from a larger text"""
-        sentences = text.split('.')
-        # Look for sentences with numbers, superlatives, or surprising facts
-        interesting_keywords = ['first', 'largest', 'smallest', 'only', 'never', 'most', 'least', 'discovered', 'invented']
-        
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in interesting_keywords):
-                if 20 < len(sentence.strip()) < 150:
-                    return sentence.strip()
-        
-        # Fallback to first meaningful sentence
-        for sentence in sentences:
-            if 20 < len(sentence.strip()) < 150:
-                return sentence.strip()
-        
-        return text[:150] + "..." if len(text) > 150 else text
+        return _interesting_fact(text)
 
     def extract_year_from_text(self, text: str) -> str:
         """Extract year from text using simple regex"""
-        import re
-        years = re.findall(r'\b(19|20)\d{2}\b', text)
-        return years[0] if years else "Unknown"
+        match = _YEAR_RE.search(text)
+        return match.group(0) if match else "Unknown"
     
     def generate_importance_statement(self, topic: str) -> str:
         """Generate importance statement for scientific topics"""
-        importance_templates = [
-            f"{topic} revolutionized our understanding of the natural world.",
-            f"The discovery of {topic} changed the course of scientific history.",
-            f"{topic} remains one of the most important concepts in modern science.",
-            f"Understanding {topic} is crucial for advancing human knowledge."
-        ]
-        return random.choice(importance_templates)
+        return random.choice(IMPORTANCE_TEMPLATES).format(topic)
 
     def get_space_data(self) -> Dict[str, Any]:
         """Collect space and astronomy facts using NASA API and Wikipedia"""
+        return self._run(self._a_get_space_data())
+    
+    async def _a_get_space_data(self) -> Dict[str, Any]:
+        """Async implementation of get_space_data"""
         try:
-            space_topics = [
-                "Black hole", "Solar System", "Mars exploration", "International Space Station",
-                "Hubble Space Telescope", "Space exploration", "Milky Way", "Supernova",
-                "Exoplanet", "Dark matter"
-            ]
-            
             space_facts = []
+            topics = random.sample(SPACE_TOPICS, 5)
             
-            # Get NASA APOD (Astronomy Picture of the Day)
-            nasa_response = requests.get(
-                f"https://api.nasa.gov/planetary/apod?api_key={self.nasa_api_key}"
+            # Get NASA APOD (Astronomy Picture of the Day) alongside the Wikipedia space facts
+            nasa_response, wiki_facts = await asyncio.gather(
+                self.http.get(f"https://api.nasa.gov/planetary/apod?api_key={self.nasa_api_key}"),
+                self._a_collect_topics(topics, self._history_fact),
+                return_exceptions=True
             )
+            
+            if isinstance(nasa_response, Exception):
+                raise nasa_response
             if nasa_response.status_code == 200:
-                apod_data = nasa_response.json()
+                apod_data = orjson.loads(nasa_response.content)
                 space_facts.append({
                     'topic': 'NASA Picture of the Day',
                     'title': apod_data.get('title', ''),
@@ -213,19 +410,8 @@ class DataCollector:
                     'date': apod_data.get('date', '')
                 })
             
-            # Get Wikipedia space facts
-            for topic in random.sample(space_topics, 5):
-                try:
-                    page = wikipedia.page(topic)
-                    fact_data = {
-                        'topic': topic,
-                        'summary': page.summary[:300] + "..." if len(page.summary) > 300 else page.summary,
-                        'interesting_fact': self.extract_interesting_fact(page.summary),
-                        'url': page.url
-                    }
-                    space_facts.append(fact_data)
-                except Exception as e:
-                    continue
+            # Space facts share the history fact shape
+            space_facts.extend(wiki_facts)
             
             return {
                 'category': 'space',
@@ -242,27 +428,12 @@ class DataCollector:
 
     def get_technology_data(self) -> Dict[str, Any]:
         """Collect technology facts and innovations"""
+        return self._run(self._a_get_technology_data())
+    
+    async def _a_get_technology_data(self) -> Dict[str, Any]:
+        """Async implementation of get_technology_data"""
         try:
-            tech_topics = [
-                "Artificial Intelligence", "Quantum Computing", "Blockchain",
-                "Internet of Things", "5G technology", "Cloud computing",
-                "Machine Learning", "Virtual Reality", "Robotics", "Cybersecurity"
-            ]
-            
-            tech_facts = []
-            
-            for topic in random.sample(tech_topics, 10):
-                try:
-                    page = wikipedia.page(topic)
-                    fact_data = {
-                        'topic': topic,
-                        'summary': page.summary[:250] + "..." if len(page.summary) > 250 else page.summary,
-                        'latest_developments': self.extract_interesting_fact(page.content),
-                        'impact': self.generate_tech_impact_statement(topic)
-                    }
-                    tech_facts.append(fact_data)
-                except Exception as e:
-                    continue
+            tech_facts = await self._a_collect_topics(random.sample(TECH_TOPICS, 10), self._tech_fact)
             
             return {
                 'category': 'technology',
@@ -276,30 +447,25 @@ class DataCollector:
         except Exception as e:
             logging.error(f"Error collecting technology data: {str(e)}")
             return self.get_fallback_technology_data()
+    
+    def _tech_fact(self, topic: str, page: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a technology fact from a page summary"""
+        summary = page['extract']
+        return {
+            'topic': topic,
+            'summary': _truncate(summary, 250),
+            'latest_developments': self.extract_interesting_fact(summary),
+            'impact': self.generate_tech_impact_statement(topic)
+        }
 
     def get_psychology_data(self) -> Dict[str, Any]:
         """Collect psychology facts and theories"""
+        return self._run(self._a_get_psychology_data())
+    
+    async def _a_get_psychology_data(self) -> Dict[str, Any]:
+        """Async implementation of get_psychology_data"""
         try:
-            psych_topics = [
-                "Cognitive psychology", "Behavioral psychology", "Social psychology",
-                "Developmental psychology", "Personality theory", "Mental health",
-                "Psychological theories", "Human behavior", "Memory", "Emotions"
-            ]
-            
-            psych_facts = []
-            
-            for topic in random.sample(psych_topics, 10):
-                try:
-                    page = wikipedia.page(topic)
-                    fact_data = {
-                        'topic': topic,
-                        'summary': page.summary[:300] + "..." if len(page.summary) > 300 else page.summary,
-                        'key_concepts': self.extract_interesting_fact(page.content),
-                        'significance': self.generate_psychology_impact(topic)
-                    }
-                    psych_facts.append(fact_data)
-                except Exception as e:
-                    continue
+            psych_facts = await self._a_collect_topics(random.sample(PSYCH_TOPICS, 10), self._psych_fact)
             
             return {
                 'category': 'psychology',
@@ -313,26 +479,38 @@ class DataCollector:
         except Exception as e:
             logging.error(f"Error collecting psychology data: {str(e)}")
             return self.get_fallback_psychology_data()
+    
+    def _psych_fact(self, topic: str, page: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a psychology fact from a page summary"""
+        summary = page['extract']
+        return {
+            'topic': topic,
+            'summary': _truncate(summary, 300),
+            'key_concepts': self.extract_interesting_fact(summary),
+            'significance': self.generate_psychology_impact(topic)
+        }
 
     def get_trending_data(self) -> Dict[str, Any]:
         """Collect trending topics and current events"""
+        return self._run(self._a_get_trending_data())
+    
+    async def _a_get_trending_data(self) -> Dict[str, Any]:
+        """Async implementation of get_trending_data"""
         try:
-            # Combine facts from different categories
-            categories = ['science', 'history', 'geography', 'space', 'technology']
+            # Combine facts from different categories, collected concurrently
+            collectors = {
+                'science': self._a_get_science_data,
+                'history': self._a_get_history_data,
+                'geography': self._a_get_geography_data,
+                'space': self._a_get_space_data,
+                'technology': self._a_get_technology_data
+            }
             trending_facts = []
             
-            for category in random.sample(categories, 3):
-                if category == 'science':
-                    data = self.get_science_data()
-                elif category == 'history':
-                    data = self.get_history_data()
-                elif category == 'geography':
-                    data = self.get_geography_data()
-                elif category == 'space':
-                    data = self.get_space_data()
-                else:
-                    data = self.get_technology_data()
-                
+            results = await asyncio.gather(*[
+                collectors[category]() for category in random.sample(list(collectors), 3)
+            ])
+            for data in results:
                 if data and 'data' in data:
                     trending_facts.extend(data['data'][:3])
             
@@ -490,21 +668,8 @@ class DataCollector:
 
     def generate_tech_impact_statement(self, topic: str) -> str:
         """Generate impact statement for technology topics"""
-        impact_templates = [
-            f"{topic} is revolutionizing how we live and work.",
-            f"The impact of {topic} on society is profound and far-reaching.",
-            f"{topic} represents a major breakthrough in technological advancement.",
-            f"The development of {topic} marks a new era in human innovation."
-        ]
-        return random.choice(impact_templates)
+        return random.choice(TECH_IMPACT_TEMPLATES).format(topic)
 
     def generate_psychology_impact(self, topic: str) -> str:
         """Generate impact statement for psychology topics"""
-        impact_templates = [
-            f"Understanding {topic} helps us improve mental health and well-being.",
-            f"Research in {topic} has transformed our understanding of human behavior.",
-            f"{topic} provides crucial insights into human development and behavior.",
-            f"The study of {topic} continues to enhance our understanding of the mind."
-        ]
-        return random.choice(impact_templates)
-
+        return random.choice(PSYCHOLOGY_IMPACT_TEMPLATES).format(topic)
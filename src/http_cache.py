@@ -0,0 +1,56 @@
+# http_cache.py - Persistent URL-keyed cache for HTTP GET responses
+import time
+import sqlite3
+import threading
+from typing import Optional, NamedTuple
+
+
+class CachedResponse(NamedTuple):
+    etag: Optional[str]
+    body: bytes
+    fresh: bool
+
+
+class HttpCache:
+    def __init__(self, db_path: str = 'wiki_cache.sqlite', expire_after: int = 86400):
+        self.expire_after = expire_after  # Seconds before an entry must be revalidated
+
+        # Shared by collector calls running on different threads
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                body BLOB,
+                fetched REAL
+            )
+        ''')
+        self.conn.commit()
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Return the cached response for a URL, if any"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT etag, body, fetched FROM http_cache WHERE url = ?", (url,)
+            ).fetchone()
+        if not row:
+            return None
+
+        etag, body, fetched = row
+        return CachedResponse(etag, body, time.time() - fetched < self.expire_after)
+
+    def put(self, url: str, etag: Optional[str], body: bytes):
+        """Store a successful response body"""
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO http_cache (url, etag, body, fetched) VALUES (?, ?, ?, ?)",
+                (url, etag, body, time.time())
+            )
+            self.conn.commit()
+
+    def touch(self, url: str):
+        """Mark a stale entry fresh again after a 304 Not Modified"""
+        with self.lock:
+            self.conn.execute("UPDATE http_cache SET fetched = ? WHERE url = ?", (time.time(), url))
+            self.conn.commit()
@@ -1,15 +1,73 @@
 # platform_uploader.py - Handles uploading content to various platforms
 import os
+import json
+import time
+import random
+import socket
+import hashlib
+import collections
 import logging
-from typing import Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Any, Callable
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.oauth2.credentials import Credentials
+from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaFileUpload
 from instagram_private_api import Client
 import requests
 
+# Files above this size are uploaded resumably so a dropped connection doesn't restart them
+RESUMABLE_THRESHOLD = 64 * 1024 * 1024
+
+# Resumable chunk sizes must be multiples of 256 KiB
+_CHUNK_UNIT = 256 * 1024
+_MIN_CHUNK = _CHUNK_UNIT
+_MAX_CHUNK = 256 * 1024 * 1024
+_START_CHUNK = 8 * 1024 * 1024
+
+# Server-side YouTube failures worth retrying; anything else (4xx) is permanent
+RETRYABLE_STATUSES = frozenset({500, 502, 503, 504})
+MAX_ATTEMPTS = 5
+
+# Shared session so upload verifications reuse connections
+_session = requests.Session()
+
+# Minimum spacing between Instagram requests from one account, in seconds
+IG_MIN_INTERVAL = 6.5
+
+
+def _build_youtube(credentials: Credentials):
+    """Build a YouTube Data API client from the discovery document bundled with the library"""
+    # Static discovery never fetches the document over the network, so there's
+    # nothing for the discovery cache to store
+    return build('youtube', 'v3', credentials=credentials, static_discovery=True, cache_discovery=False)
+
+
+class AdaptiveMediaFileUpload(MediaFileUpload):
+    """Resumable file upload whose chunk size adapts to how long each chunk takes"""
+    
+    def __init__(self, filename: str, **kwargs):
+        super().__init__(filename, chunksize=_START_CHUNK, resumable=True, **kwargs)
+    
+    def adjust(self, elapsed: float):
+        """Double the chunk size after a fast chunk (<10s), halve it after a slow one (>30s)"""
+        # next_chunk() reads chunksize() on every call, so this applies to the next chunk
+        size = self._chunksize
+        if elapsed < 10:
+            size *= 2
+        elif elapsed > 30:
+            size //= 2
+        self._chunksize = min(_MAX_CHUNK, max(_MIN_CHUNK, size // _CHUNK_UNIT * _CHUNK_UNIT))
+
+
 class PlatformUploader:
+    # YouTube OAuth credentials shared by every uploader in the process
+    _cached_credentials = None
+    
     def __init__(self):
         # YouTube API credentials
         self.youtube_scopes = [
@@ -23,28 +81,38 @@ class PlatformUploader:
         self.instagram_username = os.getenv('INSTAGRAM_USERNAME')
         self.instagram_password = os.getenv('INSTAGRAM_PASSWORD')
         
+        # Recent Instagram request times, persisted so back-to-back runs stay paced
+        self.ig_rate_file = 'credentials/ig_rate.json'
+        self._ig_bucket = collections.deque(self._load_ig_rate(), maxlen=20)
+        self._ig_lock = threading.Lock()
+        
         # Create credentials directory
         os.makedirs('credentials', exist_ok=True)
         
         # Initialize APIs
         self.youtube = self.initialize_youtube()
         self.instagram = self.initialize_instagram()
+        
+        # The three uploads of a video run side by side; the discovery client
+        # isn't thread-safe (httplib2), so each worker builds its own
+        self._upload_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix='upload')
+        self._local = threading.local()
     
     def initialize_youtube(self):
         """Initialize YouTube API client"""
         try:
-            credentials = None
+            credentials = PlatformUploader._cached_credentials
             
             # Load existing credentials
-            if os.path.exists(self.youtube_token_file):
+            if credentials is None and os.path.exists(self.youtube_token_file):
                 credentials = Credentials.from_authorized_user_file(
                     self.youtube_token_file, self.youtube_scopes
                 )
             
-            # If no valid credentials, get new ones
-            if not credentials or not credentials.valid:
-                if credentials and credentials.expired and credentials.refresh_token:
-                    credentials.refresh(requests.Request())
+            # If no valid credentials (or they expire within a minute), get new ones
+            if not credentials or not self._credentials_fresh(credentials):
+                if credentials and credentials.refresh_token:
+                    credentials.refresh(Request())
                 else:
                     flow = InstalledAppFlow.from_client_secrets_file(
                         self.youtube_credentials_file, self.youtube_scopes
@@ -52,16 +120,37 @@ class PlatformUploader:
                     credentials = flow.run_local_server(port=0)
                 
                 # Save credentials
-                with open(self.youtube_token_file, 'w') as token:
-                    token.write(credentials.to_json())
+                self._save_token(credentials)
+            
+            PlatformUploader._cached_credentials = credentials
             
             # Build YouTube API client
-            return build('youtube', 'v3', credentials=credentials)
+            return _build_youtube(credentials)
             
         except Exception as e:
             logging.error(f"Error initializing YouTube API: {str(e)}")
             return None
     
+    def _credentials_fresh(self, credentials: Credentials) -> bool:
+        """Check that credentials are valid for at least another minute"""
+        if not credentials.valid:
+            return False
+        # google-auth keeps expiry as a naive UTC datetime
+        return credentials.expiry is None or credentials.expiry - datetime.utcnow() > timedelta(seconds=60)
+    
+    def _save_token(self, credentials: Credentials):
+        """Write the token file, skipping the write when its contents haven't changed"""
+        token_json = credentials.to_json()
+        digest = hashlib.sha1(token_json.encode('utf-8')).hexdigest()
+        
+        if os.path.exists(self.youtube_token_file):
+            with open(self.youtube_token_file, 'rb') as token:
+                if hashlib.sha1(token.read()).hexdigest() == digest:
+                    return
+        
+        with open(self.youtube_token_file, 'w') as token:
+            token.write(token_json)
+    
     def initialize_instagram(self):
         """Initialize Instagram API client"""
         try:
@@ -76,175 +165,214 @@ class PlatformUploader:
             logging.error(f"Error initializing Instagram API: {str(e)}")
             return None
     
+    def _youtube_client(self):
+        """Get this thread's YouTube API client, building it on first use"""
+        client = getattr(self._local, 'youtube', None)
+        if client is None:
+            client = _build_youtube(PlatformUploader._cached_credentials)
+            self._local.youtube = client
+        return client
+    
+    def _load_ig_rate(self) -> list:
+        """Load this account's recent Instagram request timestamps"""
+        try:
+            with open(self.ig_rate_file) as f:
+                return json.load(f).get(self.instagram_username or '', [])
+        except (OSError, ValueError):
+            return []
+    
+    def _ig_throttle(self):
+        """Wait until the next Instagram request is allowed and record it"""
+        with self._ig_lock:
+            if self._ig_bucket:
+                wait = max(0, IG_MIN_INTERVAL - (time.time() - self._ig_bucket[-1]))
+                if wait:
+                    logging.info(f"Waiting {wait:.1f}s before the next Instagram request")
+                    time.sleep(wait)
+            
+            self._ig_bucket.append(time.time())
+            
+            try:
+                with open(self.ig_rate_file) as f:
+                    rates = json.load(f)
+            except (OSError, ValueError):
+                rates = {}
+            rates[self.instagram_username or ''] = list(self._ig_bucket)
+            with open(self.ig_rate_file, 'w') as f:
+                json.dump(rates, f)
+    
     def upload_to_platforms(self, video_files: Dict[str, str], content: Dict) -> Dict[str, str]:
         """Upload videos to multiple platforms"""
-        upload_results = {}
+        futures = {}
         
         # Upload long-form to YouTube
         if video_files.get('long_form'):
-            youtube_url = self.upload_to_youtube(
+            futures['youtube_url'] = self._upload_pool.submit(
+                self.upload_to_youtube,
                 video_files['long_form'],
                 content['title'],
                 content['metadata']['description'],
                 content['metadata']['tags']
             )
-            upload_results['youtube_url'] = youtube_url
         
         # Upload short-form to Instagram/YouTube Shorts
         if video_files.get('short_form'):
-            instagram_url = self.upload_to_instagram(
+            futures['instagram_url'] = self._upload_pool.submit(
+                self.upload_to_instagram,
                 video_files['short_form'],
                 content['title'],
                 content['metadata']['description']
             )
-            upload_results['instagram_url'] = instagram_url
             
             # Also upload to YouTube Shorts
-            shorts_url = self.upload_to_youtube_shorts(
+            futures['youtube_shorts_url'] = self._upload_pool.submit(
+                self.upload_to_youtube_shorts,
                 video_files['short_form'],
                 content['title'],
                 content['metadata']['description'],
                 content['metadata']['tags']
             )
-            upload_results['youtube_shorts_url'] = shorts_url
         
-        return upload_results
+        results = {}
+        for key, future in futures.items():
+            # One platform failing doesn't lose the URLs of the others
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                logging.error(f"Error uploading {key}: {str(e)}")
+                results[key] = None
+        return results
     
     def upload_to_youtube(self, video_file: str, title: str, description: str, tags: list) -> str:
         """Upload video to YouTube"""
-        try:
-            if not self.youtube:
-                raise Exception("YouTube API client not initialized")
-            
-            # Prepare video metadata
-            body = {
-                'snippet': {
-                    'title': title,
-                    'description': description,
-                    'tags': tags,
-                    'categoryId': '27'  # Education category
-                },
-                'status': {
-                    'privacyStatus': 'private',  # Start as private, can be changed later
-                    'selfDeclaredMadeForKids': False
-                }
+        if not self.youtube:
+            raise Exception("YouTube API client not initialized")
+        
+        # Prepare video metadata
+        body = {
+            'snippet': {
+                'title': title,
+                'description': description,
+                'tags': tags,
+                'categoryId': '27'  # Education category
+            },
+            'status': {
+                'privacyStatus': 'private',  # Start as private, can be changed later
+                'selfDeclaredMadeForKids': False
             }
-            
-            # Create video insert request
-            insert_request = self.youtube.videos().insert(
+        }
+        
+        response = self._insert_video(video_file, body)
+        video_id = response['id']
+        video_url = f"https://youtu.be/{video_id}"
+        
+        logging.info(f"Video uploaded successfully to YouTube: {video_url}")
+        return video_url
+    
+    def _with_retries(self, call: Callable[[], Any]) -> Any:
+        """Run an upload request, retrying transient failures with exponential backoff"""
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                return call()
+            except (HttpError, socket.timeout) as e:
+                permanent = isinstance(e, HttpError) and e.resp.status not in RETRYABLE_STATUSES
+                if permanent or attempt == MAX_ATTEMPTS - 1:
+                    raise
+                
+                delay = 2 ** attempt + random.random()
+                logging.warning(f"Transient upload error, retrying in {delay:.1f}s: {str(e)}")
+                time.sleep(delay)
+    
+    def _insert_video(self, video_file: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Upload a video file with the given metadata and return the API response"""
+        # A non-resumable upload streams the whole file in one request instead of
+        # paying a round-trip per chunk
+        if os.path.getsize(video_file) <= RESUMABLE_THRESHOLD:
+            return self._with_retries(lambda: self._youtube_client().videos().insert(
                 part=','.join(body.keys()),
                 body=body,
-                media_body=MediaFileUpload(
-                    video_file,
-                    chunksize=-1,
-                    resumable=True
-                )
-            )
-            
-            # Execute upload
-            response = None
-            while response is None:
-                status, response = insert_request.next_chunk()
-                if status:
-                    logging.info(f"Uploaded {int(status.progress() * 100)}%")
-            
-            video_id = response['id']
-            video_url = f"https://youtu.be/{video_id}"
-            
-            logging.info(f"Video uploaded successfully to YouTube: {video_url}")
-            return video_url
-            
-        except Exception as e:
-            logging.error(f"Error uploading to YouTube: {str(e)}")
-            return None
+                media_body=MediaFileUpload(video_file, resumable=False)
+            ).execute())
+        
+        media = AdaptiveMediaFileUpload(video_file)
+        insert_request = self._youtube_client().videos().insert(
+            part=','.join(body.keys()),
+            body=body,
+            media_body=media
+        )
+        
+        # A retried next_chunk() resumes from the last chunk the server acknowledged
+        response = None
+        while response is None:
+            started = time.monotonic()
+            status, response = self._with_retries(insert_request.next_chunk)
+            media.adjust(time.monotonic() - started)
+            if status:
+                logging.info(f"Uploaded {int(status.progress() * 100)}%")
+        return response
     
     def upload_to_instagram(self, video_file: str, title: str, description: str) -> str:
         """Upload video to Instagram"""
-        try:
-            if not self.instagram:
-                raise Exception("Instagram API client not initialized")
-            
-            # Prepare caption
-            caption = f"{title}\n\n{description}\n\n#educationalcontent #facts #learning"
-            
-            # Upload video
-            response = self.instagram.video_upload(
-                video_file,
-                caption=caption,
-                title=title
-            )
-            
-            # Get video URL
-            if response.get('media'):
-                video_url = f"https://instagram.com/p/{response['media']['code']}"
-                logging.info(f"Video uploaded successfully to Instagram: {video_url}")
-                return video_url
-            
-            return None
-            
-        except Exception as e:
-            logging.error(f"Error uploading to Instagram: {str(e)}")
-            return None
+        if not self.instagram:
+            raise Exception("Instagram API client not initialized")
+        
+        # Prepare caption
+        caption = f"{title}\n\n{description}\n\n#educationalcontent #facts #learning"
+        
+        # Upload video, pacing requests to stay under Instagram's throttle
+        self._ig_throttle()
+        response = self.instagram.video_upload(
+            video_file,
+            caption=caption,
+            title=title
+        )
+        
+        # Get video URL
+        if response.get('media'):
+            video_url = f"https://instagram.com/p/{response['media']['code']}"
+            logging.info(f"Video uploaded successfully to Instagram: {video_url}")
+            return video_url
+        
+        return None
     
     def upload_to_youtube_shorts(self, video_file: str, title: str, description: str, tags: list) -> str:
         """Upload video as YouTube Short"""
-        try:
-            if not self.youtube:
-                raise Exception("YouTube API client not initialized")
-            
-            # Modify title and description for Shorts
-            shorts_title = f"{title} #Shorts"
-            shorts_description = f"{description}\n\n#Shorts #EducationalShorts #LearnOnShorts"
-            
-            # Add Shorts-specific tags
-            shorts_tags = tags + ['shorts', 'educational shorts', 'learning']
-            
-            # Prepare video metadata
-            body = {
-                'snippet': {
-                    'title': shorts_title,
-                    'description': shorts_description,
-                    'tags': shorts_tags,
-                    'categoryId': '27'  # Education category
-                },
-                'status': {
-                    'privacyStatus': 'private',  # Start as private, can be changed later
-                    'selfDeclaredMadeForKids': False
-                }
+        if not self.youtube:
+            raise Exception("YouTube API client not initialized")
+        
+        # Modify title and description for Shorts
+        shorts_title = f"{title} #Shorts"
+        shorts_description = f"{description}\n\n#Shorts #EducationalShorts #LearnOnShorts"
+        
+        # Add Shorts-specific tags
+        shorts_tags = tags + ['shorts', 'educational shorts', 'learning']
+        
+        # Prepare video metadata
+        body = {
+            'snippet': {
+                'title': shorts_title,
+                'description': shorts_description,
+                'tags': shorts_tags,
+                'categoryId': '27'  # Education category
+            },
+            'status': {
+                'privacyStatus': 'private',  # Start as private, can be changed later
+                'selfDeclaredMadeForKids': False
             }
-            
-            # Create video insert request
-            insert_request = self.youtube.videos().insert(
-                part=','.join(body.keys()),
-                body=body,
-                media_body=MediaFileUpload(
-                    video_file,
-                    chunksize=-1,
-                    resumable=True
-                )
-            )
-            
-            # Execute upload
-            response = None
-            while response is None:
-                status, response = insert_request.next_chunk()
-                if status:
-                    logging.info(f"Uploaded {int(status.progress() * 100)}%")
-            
-            video_id = response['id']
-            video_url = f"https://youtube.com/shorts/{video_id}"
-            
-            logging.info(f"Short uploaded successfully to YouTube: {video_url}")
-            return video_url
-            
-        except Exception as e:
-            logging.error(f"Error uploading to YouTube Shorts: {str(e)}")
-            return None
+        }
+        
+        response = self._insert_video(video_file, body)
+        video_id = response['id']
+        video_url = f"https://youtube.com/shorts/{video_id}"
+        
+        logging.info(f"Short uploaded successfully to YouTube: {video_url}")
+        return video_url
     
     def verify_upload(self, platform: str, url: str) -> bool:
         """Verify if upload was successful by checking URL"""
         try:
-            response = requests.get(url)
+            # HEAD is enough to check the page exists without downloading it
+            response = _session.head(url, allow_redirects=True, timeout=5)
             if response.status_code == 200:
                 logging.info(f"Successfully verified upload on {platform}: {url}")
                 return True
@@ -0,0 +1,129 @@
+# script_cache.py - Exact and semantic cache for generated video content
+import json
+import hashlib
+import logging
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional
+
+import numpy as np
+import openai
+
+
+class ScriptCache:
+    def __init__(self, db_path: str = 'content_tracking.db', threshold: float = 0.93, ttl_days: float = 6):
+        self.threshold = threshold  # Cosine similarity needed for a semantic hit
+
+        # Each category runs once a week and its fixed topics recur in a new order, so an
+        # entry older than that would replay an already published video; same-day retries
+        # still hit
+        self.ttl = timedelta(days=ttl_days)
+        self.embedding_model = "text-embedding-3-small"
+
+        # Embedding computed by the last get(), reused by put() on a miss
+        self._last_lookup = (None, None)
+
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS script_cache (
+                prompt_hash TEXT PRIMARY KEY,
+                category TEXT,
+                embedding BLOB,
+                response_json TEXT,
+                created TEXT
+            )
+        ''')
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_script_cache_category ON script_cache(category, created)")
+        self.conn.commit()
+
+    def _cutoff(self) -> str:
+        """Creation time before which entries are expired"""
+        return (datetime.now() - self.ttl).isoformat()
+
+    def canonicalize(self, raw_data: Dict, category: str) -> str:
+        """Build a stable prompt string from the generation inputs"""
+        return f"{category}\n{json.dumps(raw_data, sort_keys=True)}"
+
+    def get(self, raw_data: Dict, category: str) -> Optional[Dict[str, Any]]:
+        """Return cached content, with the raw_data it was written from, for an identical or near-identical input"""
+        prompt = self.canonicalize(raw_data, category)
+        prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+
+        # Exact match
+        row = self.conn.execute(
+            "SELECT response_json FROM script_cache WHERE prompt_hash = ? AND created >= ?",
+            (prompt_hash, self._cutoff())
+        ).fetchone()
+        if row:
+            return json.loads(row[0])
+
+        # Semantic match
+        query = self.embed(prompt)
+        self._last_lookup = (prompt_hash, query)
+        if query is None:
+            return None
+
+        return self.semantic_lookup(query, category)
+
+    def put(self, raw_data: Dict, category: str, response: Dict[str, Any]):
+        """Store generated content, with the data it narrates, for future lookups"""
+        prompt = self.canonicalize(raw_data, category)
+        prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+
+        last_hash, embedding = self._last_lookup
+        if last_hash != prompt_hash:
+            embedding = self.embed(prompt)
+
+        self.conn.execute('''
+            INSERT OR REPLACE INTO script_cache (prompt_hash, category, embedding, response_json, created)
+            VALUES (?, ?, ?, ?, ?)
+        ''', (
+            prompt_hash,
+            category,
+            embedding.tobytes() if embedding is not None else None,
+            json.dumps({**response, 'raw_data': raw_data}),
+            datetime.now().isoformat()
+        ))
+        self.conn.execute("DELETE FROM script_cache WHERE created < ?", (self._cutoff(),))
+        self.conn.commit()
+
+    def embed(self, text: str) -> Optional[np.ndarray]:
+        """Embed text with OpenAI, or return None if embeddings are unavailable"""
+        if not openai.api_key:
+            return None
+
+        try:
+            response = openai.embeddings.create(model=self.embedding_model, input=text)
+            return np.asarray(response.data[0].embedding, dtype=np.float32)
+        except Exception as e:
+            logging.warning(f"Could not embed prompt for script cache: {str(e)}")
+            return None
+
+    def semantic_lookup(self, query: np.ndarray, category: str) -> Optional[Dict[str, Any]]:
+        """Find the most similar cached prompt of the same category in a single matrix multiply"""
+        # Near-identical data from another category is not a valid substitute
+        rows = self.conn.execute(
+            "SELECT prompt_hash, embedding FROM script_cache"
+            " WHERE category = ? AND created >= ? AND embedding IS NOT NULL",
+            (category, self._cutoff())
+        ).fetchall()
+        rows = [(h, blob) for h, blob in rows if len(blob) == query.nbytes]
+        if not rows:
+            return None
+
+        matrix = np.frombuffer(b''.join(blob for _, blob in rows), dtype=np.float32)
+        matrix = matrix.reshape(len(rows), query.shape[0])
+
+        norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+        scores = (matrix @ query) / np.maximum(norms, 1e-12)
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+
+        row = self.conn.execute(
+            "SELECT response_json FROM script_cache WHERE prompt_hash = ?", (rows[best][0],)
+        ).fetchone()
+
+        logging.info(f"Semantic script cache hit (similarity {scores[best]:.3f})")
+        # The script narrates the cached entry's facts, so it carries them with it
+        return json.loads(row[0])
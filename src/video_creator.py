@@ -1,20 +1,160 @@
 # video_creator.py - Automated video creation with MoviePy
 import os
+import io
+import re
+import glob
+import uuid
+import itertools
+import subprocess
 from moviepy import (
-    VideoClip, ImageClip, AudioFileClip, CompositeVideoClip, 
-    concatenate_videoclips, CompositeAudioClip, afx
+    VideoClip, ImageClip, AudioFileClip, 
+    concatenate_videoclips, CompositeAudioClip, afx, vfx
 )
+from moviepy.config import FFMPEG_BINARY
 from PIL import Image, ImageDraw, ImageFont
+import numpy as np
 import textwrap
 import random
+import functools
 from gtts import gTTS
 import logging
-from typing import Dict, List
+from typing import Dict, List, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
 
 logging.basicConfig(level=logging.INFO)
 
+FONT_BOLD = "assets/fonts/arial-bold.ttf"
+FONT_REGULAR = "assets/fonts/arial.ttf"
+
+# Solid background colors for fact clips without a background image
+BG_PALETTE = ((50, 70, 100), (70, 50, 100), (100, 70, 50))
+
+# Fact text layout (pixels), shared by every fact image
+FACT_PADDING = 20
+FACT_TITLE_Y = 50
+FACT_BODY_Y = 150
+SHADOW_OFFSET = 2
+
+
+def _fade(clip: VideoClip, duration: float) -> VideoClip:
+    """Fade a clip in and out"""
+    return clip.with_effects([vfx.FadeIn(duration), vfx.FadeOut(duration)])
+
+
+@functools.lru_cache(maxsize=32)
+def _font(path: str, size: int):
+    """Load a TrueType font once per process, falling back to Pillow's default"""
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+# Hardware H.264 encoders in order of preference, with their speed-oriented options
+HW_ENCODERS = (
+    ('h264_nvenc', ['-preset', 'p4']),
+    ('h264_videotoolbox', ['-b:v', '8M']),
+    ('h264_qsv', ['-preset', 'veryfast'])
+)
+
+# Static slides make rate-distortion trivial, so a fast x264 preset costs next to no quality
+SOFTWARE_ENCODER = ('libx264', ['-preset', 'veryfast', '-crf', '23'])
+
+
+@functools.lru_cache(maxsize=None)
+def _video_encoder() -> Tuple[str, Tuple[str, ...]]:
+    """Pick the fastest working H.264 encoder once per process"""
+    try:
+        listed = subprocess.run(
+            [FFMPEG_BINARY, '-hide_banner', '-encoders'], capture_output=True, text=True, check=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        listed = ''
+    
+    for codec, params in HW_ENCODERS:
+        if codec not in listed:
+            continue
+        
+        # Being compiled in doesn't mean the GPU/driver is present; encode a few frames to be sure
+        probe = subprocess.run(
+            [FFMPEG_BINARY, '-hide_banner', '-loglevel', 'error', '-f', 'lavfi', '-i', 'color=black:s=256x256:d=0.1',
+             '-c:v', codec, *params, '-f', 'null', '-'],
+            capture_output=True
+        )
+        if probe.returncode == 0:
+            logging.info(f"Using hardware video encoder {codec}")
+            return codec, tuple(params)
+    
+    return SOFTWARE_ENCODER[0], tuple(SOFTWARE_ENCODER[1])
+
+
+# Voiceover text is synthesized in sentence-aligned chunks of about this size, concurrently
+TTS_CHUNK_CHARS = 500
+TTS_WORKERS = 4
+
+# One pool for every voiceover: the long and short scripts are synthesized at the same time,
+# and translate.google.com answers more than a few parallel requests with HTTP 429
+_tts_pool = ThreadPoolExecutor(max_workers=TTS_WORKERS, thread_name_prefix='tts')
+
+_SENTENCE_RE = re.compile(r'[^.!?]*[.!?]+\s*|[^.!?]+')
+
+
+def _tts_chunks(text: str) -> List[str]:
+    """Group sentences into chunks of at most TTS_CHUNK_CHARS (longer sentences stay whole)"""
+    chunks = []
+    current = ''
+    for sentence in _SENTENCE_RE.findall(text):
+        if current and len(current) + len(sentence) > TTS_CHUNK_CHARS:
+            chunks.append(current)
+            current = ''
+        current += sentence
+    if current.strip():
+        chunks.append(current)
+    return chunks
+
+
+def _synthesize(text: str, path: str, **tts_options):
+    """Write gTTS speech for text to an MP3 file, fetching chunks in parallel"""
+    def fetch(chunk: str) -> bytes:
+        buffer = io.BytesIO()
+        gTTS(text=chunk, **tts_options).write_to_fp(buffer)
+        return buffer.getvalue()
+    
+    parts = list(_tts_pool.map(fetch, _tts_chunks(text)))
+    
+    # MP3 streams concatenate at frame boundaries; gTTS joins its own parts the same way
+    with open(path, 'wb') as f:
+        for part in parts:
+            f.write(part)
+
+
+def _probe_duration(path: str) -> float:
+    """Read a media file's duration from its container header"""
+    try:
+        return float(subprocess.check_output(
+            ['ffprobe', '-v', 'error', '-show_entries', 'format=duration', '-of', 'csv=p=0', path]
+        ))
+    except (OSError, ValueError, subprocess.CalledProcessError):
+        # No ffprobe on PATH (moviepy only bundles ffmpeg); let MoviePy open the file
+        with AudioFileClip(path) as clip:
+            return clip.duration
+
+
+def _ffmpeg_error(error: Exception) -> str:
+    """Readable message for a failed ffmpeg run"""
+    stderr = getattr(error, 'stderr', None)
+    return stderr.decode('utf-8', 'replace').strip()[-500:] if stderr else str(error)
+
+
+# Default for create_short_form_video's short_audio_file: None there means synthesis already failed
+_SYNTHESIZE = object()
+
+
 class VideoCreator:
-    def __init__(self):
+    def __init__(self, workers: int = 2):
+        # Number of videos rendered concurrently (long-form and short-form)
+        self.workers = workers
+        
         self.output_dir = "generated_videos"
         self.assets_dir = "assets"
         self.temp_dir = "temp"
@@ -35,28 +175,77 @@ class VideoCreator:
             'fps': 30,
             'duration_target': 45  # 45 seconds
         }
+        
+        # Per-video constants read by every frame-drawing call
+        self._long_res = self.youtube_long_specs['resolution']
+        self._short_res = self.shorts_specs['resolution']
+        self._bg_palette = BG_PALETTE
+        
+        # Unique prefix for this creator's files so concurrent runs never collide
+        self._run_id = uuid.uuid4().hex[:8]
+        self._seq = itertools.count()
+        
+        # id(fact dict) -> (fact dict, display fields), shared by the slides and short script
+        self._fact_cache = {}
+        
+        # Draw each palette background once; fact frames are composited onto them in memory
+        self._bg_images = {color: Image.new('RGBA', self._long_res, color) for color in self._bg_palette}
+    
+    def _temp_path(self, name: str) -> str:
+        """Unique path in the temp directory, removed by create_videos when done"""
+        return os.path.join(self.temp_dir, f"{self._run_id}_{next(self._seq)}_{name}")
+    
+    def _output_path(self, kind: str, category: str) -> str:
+        """Unique path for a finished video"""
+        return os.path.join(self.output_dir, f"{kind}_{category}_{self._run_id}_{next(self._seq)}.mp4")
+    
+    def _cleanup_temp(self):
+        """Remove this creator's temporary files"""
+        for path in glob.glob(os.path.join(self.temp_dir, f"{self._run_id}_*")):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
     
     def create_videos(self, content: Dict) -> Dict[str, str]:
         """Create both long-form and short-form videos"""
         try:
-            # Generate voiceover
-            audio_file = self.create_voiceover(content['script'])
-            
-            # Create long-form YouTube video
-            long_form_video = self.create_long_form_video(content, audio_file)
-            
-            # Create short-form video for Shorts/Reels
-            short_form_video = self.create_short_form_video(content, audio_file)
+            # With workers=1 the pool runs the voiceovers and then the two renders one
+            # after another; nothing submitted waits on another task, so it can't deadlock
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                # Generate both voiceovers concurrently (gTTS is network-bound) and
+                # draw the slides while they're in flight; slides don't need audio
+                audio_future = executor.submit(self.create_voiceover, content['script'])
+                short_audio_future = executor.submit(self.create_short_voiceover, content)
+                
+                long_slides = self._draw_long_slides(content)
+                short_slides = self._draw_short_slides(content)
+                
+                audio_file = audio_future.result()
+                short_audio_file = short_audio_future.result()
+                
+                # Create long-form YouTube video and short-form video for Shorts/Reels
+                # concurrently; encoding happens in ffmpeg subprocesses outside the GIL
+                long_form_future = executor.submit(self.create_long_form_video, content, audio_file, long_slides)
+                short_form_future = executor.submit(
+                    self.create_short_form_video, content, audio_file, short_audio_file, short_slides
+                )
+                
+                long_form_video = long_form_future.result()
+                short_form_video = short_form_future.result()
             
             return {
                 'long_form': long_form_video,
-                'short_form': short_form_video,
-                'audio': audio_file
+                'short_form': short_form_video
             }
             
         except Exception as e:
             logging.error(f"Error creating videos: {str(e)}")
             return {}
+        
+        finally:
+            self._cleanup_temp()
+            self._fact_cache.clear()
     
     def create_voiceover(self, script: Dict) -> str:
         """Generate AI voiceover from script"""
@@ -64,64 +253,48 @@ class VideoCreator:
             full_text = script['full_script']
             
             # Use gTTS for basic TTS (can upgrade to ElevenLabs later)
-            tts = gTTS(text=full_text, lang='en', tld='co.in', slow=False)
-            
-            audio_file = os.path.join(self.temp_dir, f"voiceover_{random.randint(1000, 9999)}.mp3")
-            tts.save(audio_file)
+            audio_file = self._temp_path("voiceover.mp3")
+            _synthesize(full_text, audio_file, lang='en', tld='co.in', slow=False)
             
             return audio_file
             
         except Exception as e:
             logging.error(f"Error creating voiceover: {str(e)}")
     
-    def create_long_form_video(self, content: Dict, audio_file: str) -> str:
+    def create_short_voiceover(self, content: Dict) -> Optional[str]:
+        """Generate the voiceover for the short-form video"""
+        try:
+            # Create condensed script for short form
+            short_script = self.condense_script_for_shorts(content)
+            if not short_script:
+                return None
+            
+            short_audio_file = self._temp_path("short_audio.mp3")
+            _synthesize(short_script, short_audio_file, lang='en', slow=False)
+            
+            return short_audio_file
+            
+        except Exception as e:
+            logging.error(f"Error creating short voiceover: {str(e)}")
+            return None
+    
+    def create_long_form_video(self, content: Dict, audio_file: str, slides: Optional[List[Image.Image]] = None) -> str:
         """Create 8-12 minute YouTube video"""
         try:
             # Get audio duration to match video length
             if audio_file:
-                audio_clip = AudioFileClip(audio_file)
-                video_duration = audio_clip.duration
+                video_duration = _probe_duration(audio_file)
             else:
                 video_duration = 480  # 8 minutes fallback
             
-            # Create video clips
-            clips = []
-            
-            # Title screen (5 seconds)
-            title_clip = self.create_title_screen(content['title'], 5)
-            clips.append(title_clip)
-            
-            # Main content with facts and visuals
-            content_clips = self.create_content_clips(content, video_duration - 10)
-            clips.extend(content_clips)
-            
-            # Subscribe reminder screen (5 seconds)
-            outro_clip = self.create_outro_screen(5)
-            clips.append(outro_clip)
-            
-            # Combine all clips
-            final_video = concatenate_videoclips(clips)
+            output_file = self._output_path('long_form', content['category'])
             
-            # Add audio
-            if audio_file:
-                final_video = final_video.set_audio(audio_clip)
-            
-            # Add background music (optional)
-            final_video = self.add_background_music(final_video)
-            
-            # Export video
-            output_file = os.path.join(self.output_dir, f"long_form_{content['category']}_{random.randint(1000, 9999)}.mp4")
-            final_video.write_videofile(
-                output_file,
-                fps=self.youtube_long_specs['fps'],
-                codec='libx264',
-                audio_codec='aac'
-            )
-            
-            # Cleanup
-            final_video.close()
-            if audio_file:
-                audio_clip.close()
+            # Static slides with fades render far faster in a single ffmpeg pass
+            try:
+                self._render_long_form_ffmpeg(content, audio_file, video_duration, output_file, slides)
+            except (OSError, subprocess.CalledProcessError) as e:
+                logging.warning(f"ffmpeg render failed, falling back to MoviePy: {_ffmpeg_error(e)}")
+                self._render_long_form_moviepy(content, audio_file, video_duration, output_file)
             
             return output_file
             
@@ -129,63 +302,85 @@ class VideoCreator:
             logging.error(f"Error creating long-form video: {str(e)}")
             return None
     
-    def create_short_form_video(self, content: Dict, audio_file: str) -> str:
+    def _draw_long_slides(self, content: Dict) -> List[Image.Image]:
+        """Draw the title, fact and outro images for the long-form video"""
+        data_items = content['raw_data']['data'][:10]  # Top 10 items
+        titles, wrapped = self._prepare_fact_layout(data_items, width=50)
+        return [
+            self._render_title_screen(content['title']),
+            *(self._compose_fact_frame(title, body, self.get_background_image(item))
+              for title, body, item in zip(titles, wrapped, data_items)),
+            self._render_outro_screen()
+        ]
+    
+    def _render_long_form_ffmpeg(self, content: Dict, audio_file: str, video_duration: float, output_file: str,
+                                 slides: Optional[List[Image.Image]] = None):
+        """Render the long-form video from pre-drawn slides with ffmpeg"""
+        images = slides or self._draw_long_slides(content)
+        clip_duration = (video_duration - 10) / (len(images) - 2)  # Equal time per fact
+        
+        # 5 second title and outro around the facts
+        timed = [(images[0], 5, 0.5)]
+        timed += [(img, clip_duration, 0.5) for img in images[1:-1]]
+        timed.append((images[-1], 5, 0.5))
+        
+        self._ffmpeg_slideshow(timed, self.youtube_long_specs['fps'], output_file, audio_file)
+    
+    def _render_long_form_moviepy(self, content: Dict, audio_file: str, video_duration: float, output_file: str):
+        """Render the long-form video through the MoviePy clip graph"""
+        # Create video clips
+        clips = []
+        
+        # Title screen (5 seconds)
+        title_clip = self.create_title_screen(content['title'], 5)
+        clips.append(title_clip)
+        
+        # Main content with facts and visuals
+        content_clips = self.create_content_clips(content, video_duration - 10)
+        clips.extend(content_clips)
+        
+        # Subscribe reminder screen (5 seconds)
+        outro_clip = self.create_outro_screen(5)
+        clips.append(outro_clip)
+        
+        # Combine all clips
+        final_video = concatenate_videoclips(clips)
+        
+        # Add audio
+        audio_clip = AudioFileClip(audio_file) if audio_file else None
+        if audio_clip:
+            final_video = final_video.with_audio(audio_clip)
+        
+        # Add background music (optional)
+        final_video = self.add_background_music(final_video)
+        
+        # Export video
+        final_video.write_videofile(
+            output_file,
+            fps=self.youtube_long_specs['fps'],
+            **self._write_params()
+        )
+        
+        # Cleanup
+        final_video.close()
+        if audio_clip:
+            audio_clip.close()
+    
+    def create_short_form_video(self, content: Dict, audio_file: str, short_audio_file: Optional[str] = _SYNTHESIZE,
+                                slides: Optional[List[Image.Image]] = None) -> str:
         """Create 30-60 second vertical video for Shorts/Reels"""
         try:
-            # Create condensed script for short form
-            short_script = self.condense_script_for_shorts(content)
-            
-            # Create short voiceover
-            if short_script:
-                short_tts = gTTS(text=short_script, lang='en', slow=False)
-                short_audio_file = os.path.join(self.temp_dir, f"short_audio_{random.randint(1000, 9999)}.mp3")
-                short_tts.save(short_audio_file)
-                
-                short_audio = AudioFileClip(short_audio_file)
-                video_duration = min(short_audio.duration, 60)  # Max 60 seconds
-            else:
-                video_duration = 45  # Fallback duration
-                short_audio = None
-            
-            # Create vertical video clips
-            clips = []
-            
-            # Hook + top 3 facts only for shorts
-            hook_clip = self.create_vertical_text_clip(content['script']['hook'], 3)
-            clips.append(hook_clip)
-            
-            # Top 3 facts with quick visuals
-            for i in range(min(3, len(content['raw_data']['data']))):
-                fact_clip = self.create_vertical_fact_clip(content['raw_data']['data'][i], i+1, 10)
-                clips.append(fact_clip)
-            
-            # Quick CTA
-            cta_clip = self.create_vertical_text_clip("Follow for more amazing facts!", 5)
-            clips.append(cta_clip)
+            # Create short voiceover unless create_videos already made (or failed to make) it
+            if short_audio_file is _SYNTHESIZE:
+                short_audio_file = self.create_short_voiceover(content)
             
-            # Combine clips
-            final_video = concatenate_videoclips(clips)
+            output_file = self._output_path('short_form', content['category'])
             
-            # Resize to vertical format
-            final_video = final_video.resize(self.shorts_specs['resolution'])
-            
-            # Add audio if available
-            if short_audio:
-                final_video = final_video.set_audio(short_audio)
-            
-            # Export
-            output_file = os.path.join(self.output_dir, f"short_form_{content['category']}_{random.randint(1000, 9999)}.mp4")
-            final_video.write_videofile(
-                output_file,
-                fps=self.shorts_specs['fps'],
-                codec='libx264',
-                audio_codec='aac'
-            )
-            
-            # Cleanup
-            final_video.close()
-            if short_audio:
-                short_audio.close()
+            try:
+                self._render_short_form_ffmpeg(content, short_audio_file, output_file, slides)
+            except (OSError, subprocess.CalledProcessError) as e:
+                logging.warning(f"ffmpeg render failed, falling back to MoviePy: {_ffmpeg_error(e)}")
+                self._render_short_form_moviepy(content, short_audio_file, output_file)
             
             return output_file
             
@@ -193,19 +388,162 @@ class VideoCreator:
             logging.error(f"Error creating short-form video: {str(e)}")
             return None
     
+    def _draw_short_slides(self, content: Dict) -> List[Image.Image]:
+        """Draw the hook, top 3 fact and CTA images for the short-form video"""
+        _, wrapped = self._prepare_fact_layout(content['raw_data']['data'][:3], width=25)
+        return [
+            self._render_vertical_text(content['script']['hook']),
+            *(self._draw_vertical_fact(f"#{i}", body) for i, body in enumerate(wrapped, 1)),
+            self._render_vertical_text("Follow for more amazing facts!")
+        ]
+    
+    def _render_short_form_ffmpeg(self, content: Dict, short_audio_file: str, output_file: str,
+                                  slides: Optional[List[Image.Image]] = None):
+        """Render the short-form video from pre-drawn slides with ffmpeg"""
+        images = slides or self._draw_short_slides(content)
+        
+        # 3 second hook, 10 seconds per fact, 5 second CTA
+        timed = [(images[0], 3, 0.3)]
+        timed += [(img, 10, 0.3) for img in images[1:-1]]
+        timed.append((images[-1], 5, 0.3))
+        
+        self._ffmpeg_slideshow(timed, self.shorts_specs['fps'], output_file, short_audio_file, music=False)
+    
+    def _render_short_form_moviepy(self, content: Dict, short_audio_file: str, output_file: str):
+        """Render the short-form video through the MoviePy clip graph"""
+        short_audio = AudioFileClip(short_audio_file) if short_audio_file else None
+        
+        # Create vertical video clips
+        clips = []
+        
+        # Hook + top 3 facts only for shorts
+        hook_clip = self.create_vertical_text_clip(content['script']['hook'], 3)
+        clips.append(hook_clip)
+        
+        # Top 3 facts with quick visuals
+        for i in range(min(3, len(content['raw_data']['data']))):
+            fact_clip = self.create_vertical_fact_clip(content['raw_data']['data'][i], i+1, 10)
+            clips.append(fact_clip)
+        
+        # Quick CTA
+        cta_clip = self.create_vertical_text_clip("Follow for more amazing facts!", 5)
+        clips.append(cta_clip)
+        
+        # Combine clips; the vertical clips are already drawn at the Shorts resolution
+        final_video = concatenate_videoclips(clips)
+        
+        # Add audio if available
+        if short_audio:
+            final_video = final_video.with_audio(short_audio)
+        
+        # Export
+        final_video.write_videofile(
+            output_file,
+            fps=self.shorts_specs['fps'],
+            **self._write_params()
+        )
+        
+        # Cleanup
+        final_video.close()
+        if short_audio:
+            short_audio.close()
+    
+    def _write_params(self) -> Dict:
+        """Encoder arguments for MoviePy's write_videofile"""
+        codec, codec_params = _video_encoder()
+        
+        # MoviePy always passes its own -preset (default 'medium') ahead of ffmpeg_params,
+        # so the encoder's preset goes through preset= instead of being given twice
+        params = list(codec_params)
+        preset = 'medium'
+        if '-preset' in params:
+            i = params.index('-preset')
+            preset = params[i + 1]
+            del params[i:i + 2]
+        
+        return {
+            'codec': codec,
+            'audio_codec': 'aac',
+            'preset': preset,
+            'ffmpeg_params': [*params, '-pix_fmt', 'yuv420p'],
+            'threads': os.cpu_count(),
+            'write_logfile': False
+        }
+    
+    def _ffmpeg_slideshow(self, slides: List[Tuple[Image.Image, float, float]], fps: int, output_file: str,
+                          audio_file: Optional[str] = None, music: bool = True):
+        """Encode (image, duration, fade) slides plus audio into a video with one ffmpeg call"""
+        cmd = [FFMPEG_BINARY, '-y', '-hide_banner', '-loglevel', 'error']
+        filters = []
+        slide_paths = []
+        
+        try:
+            # Each slide is a looped still with a fade in/out, then all are concatenated
+            for i, (img, duration, fade) in enumerate(slides):
+                slide_path = self._temp_path(f"slide_{i}.png")
+                img.save(slide_path, compress_level=1)
+                slide_paths.append(slide_path)
+                
+                cmd += ['-loop', '1', '-framerate', str(fps), '-t', f"{duration:.3f}", '-i', slide_path]
+                filters.append(
+                    f"[{i}:v]fade=t=in:st=0:d={fade},fade=t=out:st={duration - fade:.3f}:d={fade},"
+                    f"format=yuv420p[v{i}]"
+                )
+            filters.append("".join(f"[v{i}]" for i in range(len(slides))) + f"concat=n={len(slides)}:v=1:a=0[v]")
+            
+            # Voiceover plus looped background music at 10% volume (see add_background_music)
+            audio_inputs = []
+            if audio_file:
+                cmd += ['-i', audio_file]
+                audio_inputs.append(f"[{len(slides)}:a]")
+            
+            bg_music_path = os.path.join(self.assets_dir, 'background_music.mp3')
+            if music and os.path.exists(bg_music_path):
+                cmd += ['-stream_loop', '-1', '-i', bg_music_path]
+                filters.append(f"[{len(slides) + len(audio_inputs)}:a]volume=0.1[music]")
+                audio_inputs.append("[music]")
+            
+            if audio_inputs:
+                filters.append("".join(audio_inputs) + f"amix=inputs={len(audio_inputs)}:duration=longest:normalize=0[a]")
+            
+            cmd += ['-filter_complex', ";".join(filters), '-map', '[v]']
+            if audio_inputs:
+                cmd += ['-map', '[a]', '-c:a', 'aac']
+            
+            # The looped music never ends, so cap the output at the slideshow length
+            total_duration = sum(duration for _, duration, _ in slides)
+            codec, codec_params = _video_encoder()
+            cmd += ['-c:v', codec, *codec_params, '-pix_fmt', 'yuv420p', '-r', str(fps), '-t', f"{total_duration:.3f}", output_file]
+            
+            subprocess.run(cmd, check=True, capture_output=True)
+            
+        finally:
+            for slide_path in slide_paths:
+                try:
+                    os.remove(slide_path)
+                except OSError:
+                    pass
+    
     def create_title_screen(self, title: str, duration: int) -> VideoClip:
         """Create animated title screen"""
+        # Create video clip
+        title_clip = ImageClip(np.asarray(self._render_title_screen(title)), duration=duration)
+        
+        # Add fade in/out effects
+        title_clip = _fade(title_clip, 0.5)
+        
+        return title_clip
+    
+    def _render_title_screen(self, title: str) -> Image.Image:
+        """Draw the title screen image"""
         # Create background
         bg_color = (20, 25, 40)  # Dark blue background
-        img = Image.new('RGB', self.youtube_long_specs['resolution'], bg_color)
+        img = Image.new('RGB', self._long_res, bg_color)
         
         # Add title text
         draw = ImageDraw.Draw(img)
         
-        try:
-            font = ImageFont.truetype("assets/fonts/arial-bold.ttf", 72)
-        except:
-            font = ImageFont.load_default()
+        font = _font(FONT_BOLD, 72)
         
         # Wrap text
         wrapped_title = textwrap.fill(title, width=25)
@@ -215,131 +553,110 @@ class VideoCreator:
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
         
-        x = (self.youtube_long_specs['resolution'][0] - text_width) // 2
-        y = (self.youtube_long_specs['resolution'][1] - text_height) // 2
+        x = (self._long_res[0] - text_width) // 2
+        y = (self._long_res[1] - text_height) // 2
         
         # Add text with shadow effect
         draw.text((x+3, y+3), wrapped_title, font=font, fill=(0, 0, 0))  # Shadow
         draw.text((x, y), wrapped_title, font=font, fill=(255, 255, 255))  # Main text
         
-        # Save temporary image
-        temp_img_path = os.path.join(self.temp_dir, f"title_{random.randint(1000, 9999)}.png")
-        img.save(temp_img_path)
-        
-        # Create video clip
-        title_clip = ImageClip(temp_img_path, duration=duration)
-        
-        # Add fade in/out effects
-        title_clip = title_clip.fadein(0.5).fadeout(0.5)
-        
-        return title_clip
+        return img
     
     def create_content_clips(self, content: Dict, total_duration: float) -> List[VideoClip]:
         """Create main content clips with facts and visuals"""
         clips = []
         data_items = content['raw_data']['data'][:10]  # Top 10 items
+        titles, wrapped = self._prepare_fact_layout(data_items, width=50)
         
         clip_duration = total_duration / len(data_items)  # Equal time per fact
         
-        for i, item in enumerate(data_items):
-            # Create fact clip
-            fact_clip = self.create_fact_clip(item, i+1, clip_duration)
-            clips.append(fact_clip)
+        for title, body, item in zip(titles, wrapped, data_items):
+            # Text is baked into the background, so no per-frame compositing
+            frame = self._compose_fact_frame(title, body, self.get_background_image(item))
+            clips.append(_fade(ImageClip(np.asarray(frame), duration=clip_duration), 0.5))
         
         return clips
     
-    def create_fact_clip(self, fact_data: Dict, number: int, duration: float) -> VideoClip:
-        """Create individual fact clip with visuals"""
-        # Background image (stock photo or solid color)
-        bg_image = self.get_background_image(fact_data)
-        
+    def _compose_fact_frame(self, title: str, wrapped_body: str, bg_image: Optional[str] = None) -> Image.Image:
+        """Draw laid-out fact text over its background as a single RGB image"""
         if bg_image:
-            background = ImageClip(bg_image, duration=duration)
+            with Image.open(bg_image) as bg:
+                frame = bg.convert('RGBA').resize(self._long_res)
         else:
-            # Create colored background
-            bg_color = random.choice([(50, 70, 100), (70, 50, 100), (100, 70, 50)])
-            bg_img = Image.new('RGB', self.youtube_long_specs['resolution'], bg_color)
-            bg_path = os.path.join(self.temp_dir, f"bg_{random.randint(1000, 9999)}.png")
-            bg_img.save(bg_path)
-            background = ImageClip(bg_path, duration=duration)
-        
-        # Resize to fit screen
-        background = background.resize(self.youtube_long_specs['resolution'])
-        
-        # Create text overlay
-        fact_text = self.format_fact_for_display(fact_data, number)
-        text_clip = self.create_text_overlay(fact_text, duration)
+            frame = self._bg_images[random.choice(self._bg_palette)]
         
-        # Combine background and text
-        final_clip = CompositeVideoClip([background, text_clip])
-        
-        return final_clip
+        return Image.alpha_composite(frame, self._draw_fact_overlay(title, wrapped_body)).convert('RGB')
+    
+    def _prepare_fact_layout(self, data_items: List[Dict], width: int,
+                             start: int = 1) -> Tuple[List[str], List[str]]:
+        """Split and wrap every fact's display text up front: (titles, wrapped bodies)"""
+        parts = [self.format_fact_for_display(item, i).partition('\n\n') for i, item in enumerate(data_items, start)]
+        titles = [title for title, _, _ in parts]
+        wrapped = [textwrap.fill(body, width=width) for _, _, body in parts]
+        return titles, wrapped
     
     def get_background_image(self, fact_data: Dict) -> str:
         """Get relevant background image (placeholder - can integrate with Unsplash API)"""
         # This is a placeholder - you can integrate with Unsplash API for relevant images
         return None
     
-    def format_fact_for_display(self, fact_data: Dict, number: int) -> str:
-        """Format fact data for on-screen display"""
+    def _fact_fields(self, fact_data: Dict) -> Tuple[Optional[str], str, bool]:
+        """(heading, body, body is a clippable summary) for a fact, read once per video"""
+        cached = self._fact_cache.get(id(fact_data))
+        if cached is not None and cached[0] is fact_data:
+            return cached[1]
+        
         if 'name' in fact_data:
-            return f"#{number} {fact_data['name']}\n\n{fact_data.get('interesting_fact', '')}"
+            fields = (fact_data['name'], fact_data.get('interesting_fact', ''), False)
         elif 'topic' in fact_data:
-            return f"#{number} {fact_data['topic']}\n\n{fact_data.get('summary', '')[:200]}..."
+            fields = (fact_data['topic'], fact_data.get('summary', ''), True)
         else:
-            return f"#{number}\n\n{str(fact_data)}"
+            fields = (None, str(fact_data), False)
+        
+        # Outside create_videos nothing clears the cache, so keep it small
+        if len(self._fact_cache) >= 64:
+            self._fact_cache.clear()
+        self._fact_cache[id(fact_data)] = (fact_data, fields)
+        return fields
+    
+    def format_fact_for_display(self, fact_data: Dict, number: int) -> str:
+        """Format fact data for on-screen display"""
+        heading, body, clipped = self._fact_fields(fact_data)
+        if heading is None:
+            return f"#{number}\n\n{body}"
+        if clipped:
+            body = f"{body[:200]}..."
+        return f"#{number} {heading}\n\n{body}"
 
-    def create_text_overlay(self, text: str, duration: float) -> VideoClip:
-        """Create text overlay for facts"""
-        img = Image.new('RGBA', self.youtube_long_specs['resolution'], (0, 0, 0, 0))
+    def _draw_fact_overlay(self, title: str, wrapped_body: str) -> Image.Image:
+        """Draw a laid-out fact title and body onto a transparent overlay"""
+        img = Image.new('RGBA', self._long_res, (0, 0, 0, 0))
         draw = ImageDraw.Draw(img)
         
-        try:
-            title_font = ImageFont.truetype("assets/fonts/arial-bold.ttf", 48)
-            body_font = ImageFont.truetype("assets/fonts/arial.ttf", 36)
-        except:
-            title_font = body_font = ImageFont.load_default()
-        
-        # Split into title and body
-        parts = text.split('\n\n')
-        title = parts[0]
-        body = '\n\n'.join(parts[1:]) if len(parts) > 1 else ''
-        
-        # Calculate positions
-        padding = 20
-        title_y = 50
-        body_y = title_y + 100
-        
-        # Draw title with shadow
-        draw.text((padding+2, title_y+2), title, font=title_font, fill=(0, 0, 0, 200))
-        draw.text((padding, title_y), title, font=title_font, fill=(255, 255, 255, 255))
-        
-        # Draw body text with shadow
-        wrapped_body = textwrap.fill(body, width=50)
-        draw.text((padding+2, body_y+2), wrapped_body, font=body_font, fill=(0, 0, 0, 200))
-        draw.text((padding, body_y), wrapped_body, font=body_font, fill=(255, 255, 255, 255))
-        
-        # Save temporary image
-        temp_img_path = os.path.join(self.temp_dir, f"text_{random.randint(1000, 9999)}.png")
-        img.save(temp_img_path)
-        
-        # Create video clip
-        text_clip = ImageClip(temp_img_path, duration=duration)
+        title_font = _font(FONT_BOLD, 48)
+        body_font = _font(FONT_REGULAR, 36)
         
-        # Add subtle animations
-        text_clip = text_clip.fadein(0.5).fadeout(0.5)
+        # Draw title and body with shadows
+        for text, y, font in ((title, FACT_TITLE_Y, title_font), (wrapped_body, FACT_BODY_Y, body_font)):
+            draw.text((FACT_PADDING + SHADOW_OFFSET, y + SHADOW_OFFSET), text, font=font, fill=(0, 0, 0, 200))
+            draw.text((FACT_PADDING, y), text, font=font, fill=(255, 255, 255, 255))
         
-        return text_clip
+        return img
 
     def create_outro_screen(self, duration: int) -> VideoClip:
         """Create outro screen with subscribe reminder"""
-        img = Image.new('RGB', self.youtube_long_specs['resolution'], (20, 25, 40))
+        # Create video clip with fade effects
+        outro_clip = ImageClip(np.asarray(self._render_outro_screen()), duration=duration)
+        outro_clip = _fade(outro_clip, 0.5)
+        
+        return outro_clip
+    
+    def _render_outro_screen(self) -> Image.Image:
+        """Draw the subscribe reminder image"""
+        img = Image.new('RGB', self._long_res, (20, 25, 40))
         draw = ImageDraw.Draw(img)
         
-        try:
-            font = ImageFont.truetype("assets/fonts/arial-bold.ttf", 60)
-        except:
-            font = ImageFont.load_default()
+        font = _font(FONT_BOLD, 60)
         
         # Add subscribe text
         text = "Subscribe for more amazing facts!"
@@ -347,31 +664,28 @@ class VideoCreator:
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
         
-        x = (self.youtube_long_specs['resolution'][0] - text_width) // 2
-        y = (self.youtube_long_specs['resolution'][1] - text_height) // 2
+        x = (self._long_res[0] - text_width) // 2
+        y = (self._long_res[1] - text_height) // 2
         
         draw.text((x+3, y+3), text, font=font, fill=(0, 0, 0))
         draw.text((x, y), text, font=font, fill=(255, 255, 255))
         
-        # Save temporary image
-        temp_img_path = os.path.join(self.temp_dir, f"outro_{random.randint(1000, 9999)}.png")
-        img.save(temp_img_path)
-        
-        # Create video clip with fade effects
-        outro_clip = ImageClip(temp_img_path, duration=duration)
-        outro_clip = outro_clip.fadein(0.5).fadeout(0.5)
-        
-        return outro_clip
+        return img
 
     def create_vertical_text_clip(self, text: str, duration: float) -> VideoClip:
         """Create text clip for vertical short-form videos"""
-        img = Image.new('RGB', self.shorts_specs['resolution'], (20, 25, 40))
+        # Create video clip
+        text_clip = ImageClip(np.asarray(self._render_vertical_text(text)), duration=duration)
+        text_clip = _fade(text_clip, 0.3)
+        
+        return text_clip
+    
+    def _render_vertical_text(self, text: str) -> Image.Image:
+        """Draw centered text on a vertical background"""
+        img = Image.new('RGB', self._short_res, (20, 25, 40))
         draw = ImageDraw.Draw(img)
         
-        try:
-            font = ImageFont.truetype("assets/fonts/arial-bold.ttf", 48)
-        except:
-            font = ImageFont.load_default()
+        font = _font(FONT_BOLD, 48)
         
         # Wrap text for vertical format
         wrapped_text = textwrap.fill(text, width=20)
@@ -381,61 +695,43 @@ class VideoCreator:
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
         
-        x = (self.shorts_specs['resolution'][0] - text_width) // 2
-        y = (self.shorts_specs['resolution'][1] - text_height) // 2
+        x = (self._short_res[0] - text_width) // 2
+        y = (self._short_res[1] - text_height) // 2
         
         # Add text with shadow
         draw.text((x+2, y+2), wrapped_text, font=font, fill=(0, 0, 0))
         draw.text((x, y), wrapped_text, font=font, fill=(255, 255, 255))
         
-        # Save temporary image
-        temp_img_path = os.path.join(self.temp_dir, f"vertical_text_{random.randint(1000, 9999)}.png")
-        img.save(temp_img_path)
-        
-        # Create video clip
-        text_clip = ImageClip(temp_img_path, duration=duration)
-        text_clip = text_clip.fadein(0.3).fadeout(0.3)
-        
-        return text_clip
+        return img
 
     def create_vertical_fact_clip(self, fact_data: Dict, number: int, duration: float) -> VideoClip:
         """Create vertical fact clip for short-form videos"""
+        # Create video clip
+        clip = ImageClip(np.asarray(self._render_vertical_fact(fact_data, number)), duration=duration)
+        clip = _fade(clip, 0.3)
+        
+        return clip
+    
+    def _render_vertical_fact(self, fact_data: Dict, number: int) -> Image.Image:
+        """Draw a numbered fact on a vertical background"""
+        _, wrapped = self._prepare_fact_layout([fact_data], width=25, start=number)
+        return self._draw_vertical_fact(f"#{number}", wrapped[0])
+    
+    def _draw_vertical_fact(self, title: str, wrapped_fact: str) -> Image.Image:
+        """Draw a laid-out fact title and body on a vertical background"""
         # Create background
-        img = Image.new('RGB', self.shorts_specs['resolution'], (20, 25, 40))
+        img = Image.new('RGB', self._short_res, (20, 25, 40))
         draw = ImageDraw.Draw(img)
         
-        try:
-            title_font = ImageFont.truetype("assets/fonts/arial-bold.ttf", 36)
-            body_font = ImageFont.truetype("assets/fonts/arial.ttf", 30)
-        except:
-            title_font = body_font = ImageFont.load_default()
-        
-        # Format text
-        title = f"#{number}"
-        fact_text = self.format_fact_for_display(fact_data, number).split('\n\n')[1]
-        wrapped_fact = textwrap.fill(fact_text, width=25)
-        
-        # Position text
-        title_y = 50
-        fact_y = 150
+        title_font = _font(FONT_BOLD, 36)
+        body_font = _font(FONT_REGULAR, 30)
         
-        # Draw title with shadow
-        draw.text((20+2, title_y+2), title, font=title_font, fill=(0, 0, 0))
-        draw.text((20, title_y), title, font=title_font, fill=(255, 255, 255))
+        # Draw title and fact with shadows
+        for text, y, font in ((title, FACT_TITLE_Y, title_font), (wrapped_fact, FACT_BODY_Y, body_font)):
+            draw.text((FACT_PADDING + SHADOW_OFFSET, y + SHADOW_OFFSET), text, font=font, fill=(0, 0, 0))
+            draw.text((FACT_PADDING, y), text, font=font, fill=(255, 255, 255))
         
-        # Draw fact with shadow
-        draw.text((20+2, fact_y+2), wrapped_fact, font=body_font, fill=(0, 0, 0))
-        draw.text((20, fact_y), wrapped_fact, font=body_font, fill=(255, 255, 255))
-        
-        # Save temporary image
-        temp_img_path = os.path.join(self.temp_dir, f"vertical_fact_{random.randint(1000, 9999)}.png")
-        img.save(temp_img_path)
-        
-        # Create video clip
-        clip = ImageClip(temp_img_path, duration=duration)
-        clip = clip.fadein(0.3).fadeout(0.3)
-        
-        return clip
+        return img
 
     def add_background_music(self, video_clip: VideoClip) -> VideoClip:
         """Add background music to video"""
@@ -447,19 +743,19 @@ class VideoCreator:
                 
                 # Loop music if needed
                 if bg_music.duration < video_clip.duration:
-                    bg_music = afx.audio_loop(bg_music, duration=video_clip.duration)
+                    bg_music = bg_music.with_effects([afx.AudioLoop(duration=video_clip.duration)])
                 else:
-                    bg_music = bg_music.subclip(0, video_clip.duration)
+                    bg_music = bg_music.subclipped(0, video_clip.duration)
                 
                 # Reduce volume for background
-                bg_music = bg_music.volumex(0.1)
+                bg_music = bg_music.with_volume_scaled(0.1)
                 
                 # Combine with existing audio
                 if video_clip.audio is not None:
                     final_audio = CompositeAudioClip([video_clip.audio, bg_music])
-                    video_clip = video_clip.set_audio(final_audio)
+                    video_clip = video_clip.with_audio(final_audio)
                 else:
-                    video_clip = video_clip.set_audio(bg_music)
+                    video_clip = video_clip.with_audio(bg_music)
             
         except Exception as e:
             logging.warning(f"Could not add background music: {str(e)}")
@@ -478,12 +774,12 @@ class VideoCreator:
             data_items = content['raw_data']['data'][:3]
             for i, item in enumerate(data_items, 1):
                 if isinstance(item, dict):
-                    if 'name' in item:
-                        fact = f"Number {i}: {item['name']}. {item.get('interesting_fact', '')}"
-                    elif 'topic' in item:
-                        fact = f"Number {i}: {item['topic']}. {item.get('summary', '')[:100]}..."
+                    # Same fields the on-screen slides use, shorter cut of summaries
+                    heading, body, clipped = self._fact_fields(item)
+                    if heading is None:
+                        fact = f"Number {i}: {body}"
                     else:
-                        fact = f"Number {i}: {str(item)}"
+                        fact = f"Number {i}: {heading}. {body[:100] + '...' if clipped else body}"
                     script_parts.append(fact)
             
             # Add quick CTA